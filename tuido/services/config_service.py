@@ -21,6 +21,10 @@ class ConfigService:
         """Returns all field definitions as a flat list."""
         return self._repo.get_columns()
 
+    def get_table_columns(self) -> list[FieldDefinition]:
+        """Returns the field definitions shown as topics table columns."""
+        return self._repo.get_table_columns()
+
     def get_columns_dict(self) -> dict[str, FieldDefinition]:
         """Returns field definitions keyed by field name."""
         return self._repo.get_columns_dict()
@@ -1,4 +1,6 @@
+import atexit
 import logging
+import queue
 import threading
 import time
 from tuido.storage.notes.base import BaseNotesRepository
@@ -6,37 +8,59 @@ from tuido.storage.notes.base import BaseNotesRepository
 
 class NotesService:
     """
-    Service for notes management with throttle/debounce auto-save.
+    Service for notes management with debounced auto-save.
 
     The service holds the current text in memory and saves it to the
-    repository with two complementary mechanisms:
-
-    - **Throttle:** saves at most once per `THROTTLE_INTERVAL` seconds
-      while the user is actively typing.
-    - **Debounce:** saves once the user has stopped typing for
-      `DEBOUNCE_INTERVAL` seconds.
+    repository once the user has stopped typing. The debounce interval adapts
+    to the typing rhythm: it is `DEBOUNCE_GAP_FACTOR` times the gap since the
+    previous change, clamped to `MIN_DEBOUNCE_INTERVAL`..`DEBOUNCE_INTERVAL`
+    seconds, so fast typists get their notes saved soon after a burst while
+    slow typing doesn't trigger a save between keystrokes. A single
+    long-lived worker thread waits for the debounce deadline; each text change
+    only moves the deadline forward. The actual file write happens on a
+    separate writer thread fed by a one-slot queue, so a slow write never
+    delays the debounce and stale pending writes are replaced by newer text.
+    Text that is still pending when the interpreter exits is saved by
+    `flush`, the only save that is fsynced to disk.
     """
 
-    THROTTLE_INTERVAL: float = 5.0
     DEBOUNCE_INTERVAL: float = 5.0
+    MIN_DEBOUNCE_INTERVAL: float = 1.0
+    DEBOUNCE_GAP_FACTOR: float = 3.0
 
     _repo: BaseNotesRepository
     _notes: str
-    _last_throttle: float
-    _debounce_timer: threading.Timer | None
+    _notes_synced: bool
+    _pending_text: str
+    _deadline: float
+    _last_change: float
+    _wake: threading.Event
+    _worker: threading.Thread | None
+    _write_queue: queue.Queue[str]
+    _writer: threading.Thread | None
     _lock: threading.Lock
+    _save_lock: threading.Lock
 
 
     def __init__(self, repo: BaseNotesRepository) -> None:
         self._repo = repo
         self._notes = repo.load_note_text()
-        self._last_throttle = 0.0
-        self._debounce_timer = None
+        self._notes_synced = True
+        self._pending_text = self._notes
+        self._deadline = 0.0
+        self._last_change = 0.0
+        self._wake = threading.Event()
+        self._worker = None
+        self._write_queue = queue.Queue(maxsize=1)
+        self._writer = None
         self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
 
     def load(self) -> None:
         """Reload notes from the repository."""
         self._notes = self._repo.load_note_text()
+        self._notes_synced = True
+        self._pending_text = self._notes
 
     def get_notes(self) -> str:
         """Return the current in-memory notes text."""
@@ -46,26 +70,99 @@ class NotesService:
         """
         Called whenever the notes textarea content changes.
 
-        Applies throttle and debounce logic and saves asynchronously.
+        Stores the latest text and pushes the debounce deadline forward. The
+        worker threads are started on the first change.
         """
-        now = time.time()
-
-        if now - self._last_throttle >= self.THROTTLE_INTERVAL:
-            self._save(text, 'throttle')
-            self._last_throttle = now
-
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
+        now = time.monotonic()
+        with self._lock:
+            interval = min(
+                self.DEBOUNCE_INTERVAL,
+                max(
+                    self.MIN_DEBOUNCE_INTERVAL,
+                    (now - self._last_change) * self.DEBOUNCE_GAP_FACTOR,
+                ),
+            )
+            self._pending_text = text
+            self._last_change = now
+            self._deadline = now + interval
+            if self._worker is None:
+                self._start_workers()
+        self._wake.set()
+
+    def flush(self) -> None:
+        """
+        Saves the latest text synchronously and fsyncs it, unless it has
+        already been saved that way.
+        """
+        with self._lock:
+            text = self._pending_text
+        self._save(text, 'flush', sync=True)
 
-        self._debounce_timer = threading.Timer(
-            self.DEBOUNCE_INTERVAL, self._save, args=(text, 'debounce')
+    def _start_workers(self) -> None:
+        """
+        Starts the debounce and writer daemon threads and registers `flush` to
+        run at exit, since daemon threads are killed without finishing.
+        """
+        self._worker = threading.Thread(
+            target=self._debounce_loop, daemon=True
         )
-        self._debounce_timer.start()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._worker.start()
+        self._writer.start()
+        atexit.register(self.flush)
 
-    def _save(self, text: str, reason: str) -> None:
-        if self._notes != text:
+    def _debounce_loop(self) -> None:
+        """
+        Waits for a text change, waits until the debounce deadline has passed
+        without further changes and then hands the latest text to the writer.
+        Every change wakes the loop, since the adaptive interval may move the
+        deadline closer.
+        """
+        while True:
+            self._wake.wait()
+            while True:
+                self._wake.clear()
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wake.wait(remaining)
+            with self._lock:
+                text = self._pending_text
+            self._enqueue_write(text)
+
+    def _enqueue_write(self, text: str) -> None:
+        """
+        Puts the text into the write queue, replacing a pending write that the
+        writer has not picked up yet.
+        """
+        while True:
+            try:
+                self._write_queue.put_nowait(text)
+                return
+            except queue.Full:
+                try:
+                    self._write_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _write_loop(self) -> None:
+        """Saves each text taken from the write queue."""
+        while True:
+            self._save(self._write_queue.get(), 'debounce')
+
+    def _save(
+        self, text: str, reason: str = 'debounce', sync: bool = False
+    ) -> None:
+        """
+        Saves the text if it differs from the last saved notes. The string
+        comparison returns right away when the lengths differ, which is the
+        usual case after an edit. With `sync`, unchanged text is written
+        again if its last save wasn't fsynced.
+        """
+        with self._save_lock:
+            if self._notes == text and (self._notes_synced or not sync):
+                return
             self._notes = text
-            self._repo.save_note_text(text)
-            logging.info(
-                f'[{time.strftime("%X")}] [{reason}] Notes saved.'
-            )
+            self._notes_synced = sync
+            self._repo.save_note_text(text, sync)
+        logging.info('[%s] [%s] Notes saved.', time.strftime('%X'), reason)
@@ -1,6 +1,8 @@
+import bisect
 import logging
 from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from termz.util.datetime import (
     date_to_timestamp, date_diff, today_timestamp
 )
@@ -9,6 +11,23 @@ from tuido.services.config_service import ConfigService
 from tuido.storage.tasks.base import BaseTaskRepository
 
 
+# Sort placeholder for tasks without start/end date
+_MAX_DATE = datetime(3000, 1, 1).timestamp()
+
+# Priority lookups, unknown numbers/strings map to TaskPriority.NONE
+_PRIORITIES_BY_NUMBER = {p.value: p for p in TaskPriority}
+_PRIORITY_NUMBERS     = {p.name: p.value for p in TaskPriority}
+
+
+@lru_cache(maxsize=4096)
+def _timestamp(date_str: str) -> float | None:
+    """
+    Memoized `date_to_timestamp` for "YYYY-MM-DD" strings. Tasks share few
+    distinct dates, and every sort and load converts them again.
+    """
+    return date_to_timestamp(date_str, english_format=True)
+
+
 class TasksService:
     """
     Business logic for task management.
@@ -21,6 +40,7 @@ class TasksService:
     _config: ConfigService
     _tasks: dict[str, list[Task]]
     _column_names: list[str]
+    _column_indices: dict[str, int]
     _column_captions: dict[str, str]
 
 
@@ -30,6 +50,7 @@ class TasksService:
         self._repo = repo
         self._config = config
         self._column_names = config.get_task_column_names()
+        self._column_indices = self._index_column_names(self._column_names)
         self._column_captions = config.get_task_column_captions()
         self._tasks = {}
         self._load_tasks_from_repository()
@@ -37,6 +58,7 @@ class TasksService:
     def load(self) -> None:
         """Re-reads config and reload tasks from the repository."""
         self._column_names = self._config.get_task_column_names()
+        self._column_indices = self._index_column_names(self._column_names)
         self._column_captions = self._config.get_task_column_captions()
         self._tasks = {}
         self._load_tasks_from_repository()
@@ -49,6 +71,10 @@ class TasksService:
         """Returns the ordered list of kanban column names."""
         return self._column_names
 
+    def get_column_index(self, column_name: str) -> int:
+        """Returns the position of a column in the ordered column names."""
+        return self._column_indices[column_name]
+
     def get_column_captions(self) -> dict[str, str]:
         """Returns a mapping of column name → display caption."""
         return self._column_captions
@@ -73,12 +99,8 @@ class TasksService:
             The new Task object and its index after sorting.
         """
         task = self._create_task(column_name, task_raw)
-        if column_name not in self._tasks:
-            self._tasks[column_name] = []
-        self._tasks[column_name].append(task)
-        self._sort_column(column_name)
+        index = self._insert_task_sorted(column_name, task)
         self._save_tasks()
-        index = self._find_task_index(column_name, task)
         return task, index
 
     def update_task(
@@ -90,7 +112,14 @@ class TasksService:
         """
         Replaces an existing task with updated data and returns the updated
         `Task` and its new index after sorting.
+
+        If the data equals the existing task, nothing is changed or saved and
+        the existing `Task` and its index are returned.
         """
+        tasks = self._tasks.get(column_name, [])
+        if 0 <= task_index < len(tasks) \
+        and self._task_equals_raw(tasks[task_index], task_raw):
+            return tasks[task_index], task_index
         self._delete_task_from_memory(column_name, task_index)
         return self.add_task(column_name, task_raw)
 
@@ -106,40 +135,21 @@ class TasksService:
         Moves a task from one column to another and returns the moved `Task` and
         its new index in the target column.
         """
-        task = self._tasks[source_col][task_index]
-        self._delete_task_from_memory(source_col, task_index)
+        task = self._tasks[source_col].pop(task_index)
         task.column_name = target_col
-        if target_col not in self._tasks:
-            self._tasks[target_col] = []
-        self._tasks[target_col].append(task)
-        self._sort_tasks()
+        new_index = self._insert_task_sorted(target_col, task)
         self._save_tasks()
-        new_index = self._find_task_index(target_col, task)
         return task, new_index
 
     def num_to_priority(self, priority_number: int) -> TaskPriority:
         """Converts a priority number (1-4) to a `TaskPriority` enum value."""
-        match priority_number:
-            case 1:
-                return TaskPriority.HIGH
-            case 2:
-                return TaskPriority.MEDIUM
-            case 3:
-                return TaskPriority.LOW
-            case _:
-                return TaskPriority.NONE
+        return _PRIORITIES_BY_NUMBER.get(priority_number, TaskPriority.NONE)
 
     def priority_str_to_num(self, priority_string: str) -> int:
         """Converts a priority string to a number (1-4)."""
-        match str(priority_string).upper():
-            case 'HIGH':
-                return 1
-            case 'MEDIUM':
-                return 2
-            case 'LOW':
-                return 3
-            case _:
-                return 4
+        return _PRIORITY_NUMBERS.get(
+            str(priority_string).upper(), TaskPriority.NONE.value
+        )
 
     def _load_tasks_from_repository(self) -> None:
         """
@@ -147,26 +157,27 @@ class TasksService:
         raw dicts to `Task` objects and sorting them by priority and dates.
         """
         raw = self._repo.load_task()
+        today = today_timestamp()
         for column_name, tasks_list in raw.items():
-            self._tasks[column_name] = []
-            for task_dict in tasks_list:
-                task = self._create_task(column_name, task_dict)
-                self._tasks[column_name].append(task)
+            self._tasks[column_name] = [
+                self._create_task(column_name, task_dict, today)
+                for task_dict in tasks_list
+            ]
         self._sort_tasks()
-        logging.info(
-            f'TasksService: loaded {sum(len(v) for v in self._tasks.values())}'
-             ' tasks.'
-        )
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(
+                'TasksService: loaded %d tasks.',
+                sum(len(v) for v in self._tasks.values()),
+            )
 
     def _save_tasks(self) -> None:
         """
         Saves the in-memory tasks to the repository, converting `Task` objects
-        to raw dicts and ensuring they are sorted by priority and dates.
+        to raw dicts. The columns are not sorted again: they are sorted on load
+        and every insertion goes through `_insert_task_sorted`.
         """
-        self._sort_tasks()
-        cleaned: dict[str, list[dict[str, object]]] = {}
-        for col, tasks in self._tasks.items():
-            cleaned[col] = [
+        cleaned: dict[str, list[dict[str, object]]] = {
+            col: [
                 {
                     'description': t.description,
                     'priority':    t.priority.value,
@@ -175,42 +186,71 @@ class TasksService:
                 }
                 for t in tasks
             ]
+            for col, tasks in self._tasks.items()
+        }
         self._repo.save_task(cleaned)
         logging.info('TasksService: tasks saved.')
 
     def _create_task(
-        self, column_name: str, task_dict: Mapping[str, object]
+        self,
+        column_name: str,
+        task_dict: Mapping[str, object],
+        today: float | None = None,
     ) -> Task:
-        """Creates a Task object from raw task data."""
+        """
+        Creates a Task object from raw task data. `today` is the timestamp of
+        today's date; callers creating many tasks pass it in so it isn't
+        computed for every date.
+        """
+        if today is None:
+            today = today_timestamp()
+        start_date = str(task_dict.get('start_date', ''))
+        end_date   = str(task_dict.get('end_date', ''))
         return Task(
             column_name  = column_name,
             description  = str(task_dict.get('description', '')),
             priority     = self.num_to_priority(
                                int(str(task_dict.get('priority', 4)))
                            ),
-            start_date   = str(task_dict.get('start_date', '')),
-            end_date     = str(task_dict.get('end_date', '')),
-            days_to_start= self._days_to(str(task_dict.get('start_date', ''))),
-            days_to_end  = self._days_to(str(task_dict.get('end_date', ''))),
+            start_date   = start_date,
+            end_date     = end_date,
+            days_to_start= self._days_to(start_date, today),
+            days_to_end  = self._days_to(end_date, today),
+        )
+
+    def _task_equals_raw(
+        self, task: Task, task_raw: Mapping[str, object]
+    ) -> bool:
+        """Checks whether the raw task data describes the given task."""
+        return (
+            task.description == str(task_raw.get('description', ''))
+            and task.priority == self.num_to_priority(
+                int(str(task_raw.get('priority', 4)))
+            )
+            and task.start_date == str(task_raw.get('start_date', ''))
+            and task.end_date == str(task_raw.get('end_date', ''))
         )
 
     def _delete_task_from_memory(
         self, column_name: str, task_index: int
     ) -> None:
         """Deletes a task from the in-memory store by column name and index."""
-        if column_name in self._tasks \
-        and 0 <= task_index < len(self._tasks[column_name]):
-            del self._tasks[column_name][task_index]
+        tasks = self._tasks.get(column_name)
+        if tasks is not None and 0 <= task_index < len(tasks):
+            del tasks[task_index]
 
-    def _find_task_index(self, column_name: str, task: Task) -> int:
+    def _insert_task_sorted(self, column_name: str, task: Task) -> int:
         """
-        Returns the index of a task in a column after sorting or 0 if not found.
+        Inserts a task into an already sorted column at the position given by
+        the sort order and returns its index. Tasks with an equal sort key
+        keep their order, i.e. the new task is placed after them.
         """
-        tasks = self._tasks.get(column_name, [])
-        for i, t in enumerate(tasks):
-            if t is task:
-                return i
-        return 0
+        tasks = self._tasks.setdefault(column_name, [])
+        index = bisect.bisect_right(
+            tasks, self._sort_key(task), key=self._sort_key
+        )
+        tasks.insert(index, task)
+        return index
 
     def _sort_tasks(self) -> None:
         """
@@ -229,22 +269,33 @@ class TasksService:
         start date and end date (earliest → latest). Tasks with missing dates
         are treated as having a very distant future date for sorting purposes.
         """
-        MAX_DATE = datetime(3000, 1, 1).timestamp()
-        self._tasks[column_name].sort(key=lambda t: (
-            t.priority.value,
-            date_to_timestamp(t.start_date, english_format=True) or MAX_DATE,
-            date_to_timestamp(t.end_date,   english_format=True) or MAX_DATE,
-            t.description.lower()
-        ))
+        self._tasks[column_name].sort(key=self._sort_key)
+
+    @staticmethod
+    def _sort_key(task: Task) -> tuple[int, float, float, str]:
+        """Returns the key used to sort the tasks of a column."""
+        start = _timestamp(task.start_date)
+        end   = _timestamp(task.end_date)
+        return (
+            task.priority.value,
+            start or _MAX_DATE,
+            end or _MAX_DATE,
+            task.description.lower(),
+        )
+
+    @staticmethod
+    def _index_column_names(column_names: list[str]) -> dict[str, int]:
+        """Returns a mapping of column name → position."""
+        return {name: i for i, name in enumerate(column_names)}
 
     @staticmethod
-    def _days_to(date_str: str) -> int | None:
+    def _days_to(date_str: str, today: float) -> int | None:
         """
-        Returns the number of days from today to the given date string in
-        "YYYY-MM-DD" format. Negative if the date is in the past, `None` if the
-        date string is empty or invalid.
+        Returns the number of days from `today` (a timestamp) to the given date
+        string in "YYYY-MM-DD" format. Negative if the date is in the past,
+        `None` if the date string is empty or invalid.
         """
-        ts = date_to_timestamp(date_str, english_format=True)
+        ts = _timestamp(date_str)
         if ts:
-            return date_diff(ts, today_timestamp())
+            return date_diff(ts, today)
         return None
@@ -1,6 +1,6 @@
 import logging
+from datetime import date
 from termz.util.datetime import today_date
-from tuido.domain.models import FieldDefinition
 from tuido.services.config_service import ConfigService
 from tuido.storage.topics.base import BaseTopicRepository
 
@@ -17,6 +17,11 @@ class TopicsService:
     _config: ConfigService
     _data: list[dict[str, object]]
     _topics_by_id: dict[int, dict[str, object]]
+    _index_by_id: dict[int, int]
+    _max_id: int
+    _date_fields_on_create: tuple[str, ...]
+    _date_fields_on_edit: tuple[str, ...]
+    _today_cache: tuple[int, str] | None = None
 
 
     def __init__(
@@ -26,12 +31,17 @@ class TopicsService:
         self._config = config
         self._data = []
         self._topics_by_id = {}
+        self._index_by_id = {}
+        self._max_id = 0
+        self._collect_computed_fields()
         self._load_topics()
 
     def load_topics(self) -> None:
         """Reloads topics from the repository."""
         self._data = []
         self._topics_by_id = {}
+        self._index_by_id = {}
+        self._collect_computed_fields()
         self._load_topics()
 
     def get_all_topics(self) -> list[dict[str, object]]:
@@ -49,15 +59,17 @@ class TopicsService:
         The new topic gets the next available integer ID and has all
         configured field functions applied (e.g. `created_date`).
         """
-        new_id = max((int(str(t['id'])) for t in self._data), default=0) + 1
+        new_id = self._max_id + 1
+        self._max_id = new_id
         new_topic: dict[str, object] = {'id': new_id}
         for col in self._config.get_columns():
             new_topic[col.name] = ''
         new_topic = self._apply_field_functions(new_topic, action='new')
         self._data.append(new_topic)
         self._topics_by_id[new_id] = new_topic
+        self._index_by_id[new_id] = len(self._data) - 1
         self._save()
-        logging.info(f'TopicsService: created topic id={new_id}.')
+        logging.info('TopicsService: created topic id=%s.', new_id)
         return new_topic
 
     def update_topic(
@@ -65,38 +77,68 @@ class TopicsService:
     ) -> dict[str, object]:
         """
         Updates a topic, applies field functions, persists it and returns the
-        final updated topic dict.
+        final updated topic dict. The topic keeps its position in the list.
         """
-        old = self._topics_by_id.get(topic_id)
-        if old is None:
-            logging.warning(f'TopicsService: topic {topic_id} not found.')
+        index = self._index_by_id.get(topic_id)
+        if index is None:
+            logging.warning('TopicsService: topic %s not found.', topic_id)
             return updated_topic
-        self._data.remove(old)
         updated_topic = self._apply_field_functions(updated_topic, action='edit')
-        self._data.append(updated_topic)
+        self._data[index] = updated_topic
         self._topics_by_id[topic_id] = updated_topic
         self._save()
-        logging.info(f'TopicsService: updated topic id={topic_id}.')
+        logging.info('TopicsService: updated topic id=%s.', topic_id)
         return updated_topic
 
     def delete_topic(self, topic_id: int) -> None:
-        """Removes a topic by ID and persists it."""
-        topic = self._topics_by_id.pop(topic_id, None)
-        if topic:
-            self._data.remove(topic)
+        """
+        Removes a topic by ID and persists it. The list positions of the
+        topics after it move up by one.
+        """
+        index = self._index_by_id.pop(topic_id, None)
+        if index is not None:
+            del self._topics_by_id[topic_id]
+            del self._data[index]
+            for other_id, other_index in self._index_by_id.items():
+                if other_index > index:
+                    self._index_by_id[other_id] = other_index - 1
+            if topic_id == self._max_id:
+                self._max_id = max(self._topics_by_id, default=0)
             self._save()
-        logging.info(f'TopicsService: deleted topic id={topic_id}.')
+        logging.info('TopicsService: deleted topic id=%s.', topic_id)
 
     def _load_topics(self) -> None:
         """
-        Loads topics from the repository into memory and builds the ID index.
+        Loads topics from the repository into memory, builds the ID indexes
+        (topic and list position) and remembers the highest ID for the
+        creation of new topics.
         """
         self._data = self._repo.load_topics()
-        for topic in self._data:
-            tid = topic.get('id')
-            if tid is not None:
-                self._topics_by_id[int(str(tid))] = topic
-        logging.info(f'TopicsService: loaded {len(self._data)} topics.')
+        self._index_by_id = {
+            int(str(topic['id'])): index
+            for index, topic in enumerate(self._data)
+            if topic.get('id') is not None
+        }
+        self._topics_by_id = {
+            topic_id: self._data[index]
+            for topic_id, index in self._index_by_id.items()
+        }
+        self._max_id = max(self._topics_by_id, default=0)
+        logging.info('TopicsService: loaded %d topics.', len(self._data))
+
+    def _collect_computed_fields(self) -> None:
+        """
+        Collects the names of the fields that get today's date when a topic
+        is created (`created_date` and `edit_date`) and when it is edited
+        (`edit_date` only) from the current config.
+        """
+        columns = self._config.get_columns()
+        self._date_fields_on_edit = tuple(
+            col.name for col in columns if col.computed == 'edit_date'
+        )
+        self._date_fields_on_create = tuple(
+            col.name for col in columns if col.computed == 'created_date'
+        ) + self._date_fields_on_edit
 
     def _save(self) -> None:
         self._repo.save_topics(self._data)
@@ -105,18 +147,29 @@ class TopicsService:
     def _apply_field_functions(
         self, topic: dict[str, object], action: str
     ) -> dict[str, object]:
-        """Applies `created_date`/`edit_date` computed fields."""
-        today = today_date(english_format=True)
-        columns_dict: dict[str, FieldDefinition] = \
-            self._config.get_columns_dict()
-
-        for field_name, field_def in columns_dict.items():
-            match field_def.computed:
-                case 'created_date':
-                    if action == 'new':
-                        topic[field_name] = today
-                case 'edit_date':
-                    topic[field_name] = today
-                case _:
-                    pass
+        """
+        Applies `created_date`/`edit_date` computed fields. Only the fields
+        collected by `_collect_computed_fields` are visited, and the topic is
+        returned right away if the action has none.
+        """
+        if action == 'new':
+            field_names = self._date_fields_on_create
+        else:
+            field_names = self._date_fields_on_edit
+        if not field_names:
+            return topic
+
+        today = self._today()
+        for field_name in field_names:
+            topic[field_name] = today
         return topic
+
+    def _today(self) -> str:
+        """
+        Returns today's date as formatted by `today_date`. The string is only
+        rebuilt when the day changes.
+        """
+        ordinal = date.today().toordinal()
+        if self._today_cache is None or self._today_cache[0] != ordinal:
+            self._today_cache = (ordinal, today_date(english_format=True))
+        return self._today_cache[1]
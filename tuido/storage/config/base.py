@@ -15,6 +15,11 @@ class BaseConfigRepository(ABC):
         """Returns all field definitions as a flat list."""
         ...
 
+    @abstractmethod
+    def get_table_columns(self) -> list[FieldDefinition]:
+        """Returns the field definitions shown as topics table columns."""
+        ...
+
     @abstractmethod
     def get_columns_dict(self) -> dict[str, FieldDefinition]:
         """Returns field definitions keyed by field name."""
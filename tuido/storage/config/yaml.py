@@ -1,9 +1,16 @@
 import os
+import sys
 import yaml
+from typing import Any
 from tuido.domain.errors import ConfigNotFoundError
 from tuido.domain.models import FieldDefinition, FieldType
 from tuido.storage.config.base import BaseConfigRepository
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 class YamlConfigRepository(BaseConfigRepository):
     """
@@ -15,6 +22,7 @@ class YamlConfigRepository(BaseConfigRepository):
 
     _fields: list[list[dict[str, object]]]
     _columns: list[FieldDefinition]
+    _table_columns: list[FieldDefinition]
     _columns_dict: dict[str, FieldDefinition]
     _task_column_names: list[str]
     _task_column_captions: dict[str, str]
@@ -23,6 +31,7 @@ class YamlConfigRepository(BaseConfigRepository):
     def __init__(self, yaml_path: str | None = None) -> None:
         self._fields = []
         self._columns = []
+        self._table_columns = []
         self._columns_dict = {}
         self._task_column_names = []
         self._task_column_captions = {}
@@ -30,45 +39,38 @@ class YamlConfigRepository(BaseConfigRepository):
             self.load_config(yaml_path)
 
     def load_config(self, yaml_path: str) -> None:
-        """Loads and parses the YAML configuration from the given file path."""
+        """
+        Loads and parses the YAML configuration from the given file path.
+
+        Field and task column names are interned, because they are used as
+        dict keys all over the app.
+        """
         if not os.path.exists(yaml_path):
             raise ConfigNotFoundError(yaml_path)
 
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
-
-        self._fields = config_data['fields']
-        self._columns = []
-        self._columns_dict = {}
-        self._task_column_names = []
-        self._task_column_captions = {}
-
-        for row in config_data['fields']:
-            for col in row:
-                field = FieldDefinition(
-                    name               = col['name'],
-                    caption            = col['caption'],
-                    type               = self._parse_field_type(col['type']),
-                    lines              = col.get('lines', 1),
-                    options            = col.get('options', []),
-                    show_in_table      = self._parse_show_in_table(
-                                            col.get('table_column_width')
-                                        ),
-                    table_column_width = self._parse_column_width(
-                                            col.get('table_column_width')
-                                        ),
-                    input_width        = col.get('input_width', None),
-                    read_only          = col.get('read_only', False),
-                    computed           = col.get('computed', None),
-                )
-                self._columns.append(field)
-                self._columns_dict[col['name']] = field
-
-        for task_col in config_data['task_columns']:
-            name    = task_col['name']
-            caption = task_col['caption']
-            self._task_column_names.append(name)
-            self._task_column_captions[name] = caption
+        # Read as bytes, the loader detects and decodes the encoding itself
+        with open(yaml_path, 'rb') as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
+
+        self._fields  = config_data['fields']
+        self._columns = [
+            self._build_field_definition(col)
+            for row in config_data['fields']
+            for col in row
+        ]
+        self._table_columns = [
+            field for field in self._columns if field.show_in_table
+        ]
+        self._columns_dict = {field.name: field for field in self._columns}
+
+        task_columns = config_data['task_columns']
+        self._task_column_names = [
+            sys.intern(str(task_col['name'])) for task_col in task_columns
+        ]
+        self._task_column_captions = {
+            name: task_col['caption']
+            for name, task_col in zip(self._task_column_names, task_columns)
+        }
 
     def get_fields(self) -> list[list[dict[str, object]]]:
         return self._fields
@@ -76,6 +78,9 @@ class YamlConfigRepository(BaseConfigRepository):
     def get_columns(self) -> list[FieldDefinition]:
         return self._columns
 
+    def get_table_columns(self) -> list[FieldDefinition]:
+        return self._table_columns
+
     def get_columns_dict(self) -> dict[str, FieldDefinition]:
         return self._columns_dict
 
@@ -85,35 +90,50 @@ class YamlConfigRepository(BaseConfigRepository):
     def get_task_column_captions(self) -> dict[str, str]:
         return self._task_column_captions
 
-    @staticmethod
-    def _parse_field_type(type_str: str) -> FieldType:
-        """Parses the field type string from the YAML into a FieldType enum."""
-        match type_str.upper():
-            case 'STRING':
-                return FieldType.STRING
-            case 'NUMBER':
-                return FieldType.NUMBER
-            case 'SELECT':
-                return FieldType.SELECT
-            case 'DATE':
-                return FieldType.DATE
-            case _:
-                raise ValueError(f'Unknown field type: {type_str}')
+    @classmethod
+    def _build_field_definition(
+        cls, col: dict[str, Any]
+    ) -> FieldDefinition:
+        """Builds the definition of a field from its YAML entry."""
+        show_in_table, column_width = cls._parse_column_width(
+            col.get('table_column_width')
+        )
+        return FieldDefinition(
+            name               = sys.intern(str(col['name'])),
+            caption            = col['caption'],
+            type               = cls._parse_field_type(col['type']),
+            lines              = col.get('lines', 1),
+            options            = col.get('options', []),
+            show_in_table      = show_in_table,
+            table_column_width = column_width,
+            input_width        = col.get('input_width', None),
+            read_only          = col.get('read_only', False),
+            computed           = col.get('computed', None),
+        )
 
     @staticmethod
-    def _parse_show_in_table(width: str | None) -> bool:
+    def _parse_field_type(type_str: str) -> FieldType:
         """
-        Determines whether to show the field as a table column based on the
-        presence and validity of the `table_column_width` value.
+        Parses the field type string from the YAML into a FieldType enum by
+        looking up the member with that (case-insensitive) name.
         """
-        return width is not None and int(width) >= 0
+        try:
+            return FieldType[type_str.upper()]
+        except KeyError:
+            raise ValueError(f'Unknown field type: {type_str}') from None
 
     @staticmethod
-    def _parse_column_width(width: str | None) -> int:
+    def _parse_column_width(width: str | None) -> tuple[bool, int]:
         """
-        Parses the `table_column_width` value from the YAML into an integer
-        width.
+        Parses the `table_column_width` value from the YAML.
+
+        Returns whether to show the field as a table column, which requires a
+        non-negative width, and the integer width (-1 if the field isn't
+        shown).
         """
-        if width is not None and int(width) >= 0:
-            return int(width)
-        return -1
+        if width is None:
+            return False, -1
+        parsed = int(width)
+        if parsed < 0:
+            return False, -1
+        return True, parsed
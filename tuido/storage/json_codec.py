@@ -0,0 +1,28 @@
+"""
+JSON decoding for the JSON repositories.
+
+Uses `orjson` (see the `speedups` extra) when it is installed and falls back
+to the standard library `json` module otherwise. Encoding always uses `json`,
+because `orjson` can only indent by two spaces and the data files are written
+with an indentation of four.
+"""
+import json
+from types import ModuleType
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(content: str) -> object:
+    """Parses a JSON document, using `orjson` if available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(obj: object) -> str:
+    """Serializes `obj` as JSON with an indentation of four spaces."""
+    return json.dumps(obj, indent=4)
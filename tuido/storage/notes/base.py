@@ -10,6 +10,9 @@ class BaseNotesRepository(ABC):
         ...
 
     @abstractmethod
-    def save_note_text(self, text: str) -> None:
-        """Persists the notes text."""
+    def save_note_text(self, text: str, sync: bool = False) -> None:
+        """
+        Persists the notes text. With `sync`, the write is flushed to disk
+        before returning.
+        """
         ...
@@ -16,11 +16,14 @@ class MarkdownNotesRepository(BaseNotesRepository):
     def set_path(self, md_path: str) -> None:
         """
         Sets the path to the Markdown file and creates it if it doesn't exist.
+        Opening in exclusive mode checks and creates in a single call.
         """
         self._path = md_path
-        if not os.path.exists(self._path):
-            with open(self._path, 'w', encoding='utf-8') as f:
+        try:
+            with open(self._path, 'x', encoding='utf-8') as f:
                 f.write('')
+        except FileExistsError:
+            pass
 
     def load_note_text(self) -> str:
         """Loads and returns the notes text from the Markdown file."""
@@ -29,9 +32,21 @@ class MarkdownNotesRepository(BaseNotesRepository):
         with open(self._path, 'r', encoding='utf-8') as f:
             return f.read()
 
-    def save_note_text(self, text: str) -> None:
-        """Saves the notes text to the Markdown file."""
+    def save_note_text(self, text: str, sync: bool = False) -> None:
+        """
+        Saves the notes text to the Markdown file.
+
+        The text is written to a temporary file which then replaces the
+        Markdown file, so an interrupted write never leaves a truncated file.
+        The temporary file is only fsynced if `sync` is set, which keeps the
+        disk flush off the frequent auto-save path.
+        """
         if self._path is None:
             return
-        with open(self._path, 'w', encoding='utf-8') as f:
+        tmp_path = f'{self._path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             f.write(text)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
@@ -1,5 +1,5 @@
-import json
-import os
+from typing import cast
+from tuido.storage import json_codec
 from tuido.storage.tasks.base import BaseTaskRepository
 
 
@@ -15,11 +15,16 @@ class JsonTaskRepository(BaseTaskRepository):
             self.set_path(json_path)
 
     def set_path(self, json_path: str) -> None:
-        """Sets the path to the JSON file and creates it if it doesn't exist."""
+        """
+        Sets the path to the JSON file and creates it if it doesn't exist.
+        Opening in exclusive mode checks and creates in a single call.
+        """
         self._path = json_path
-        if not os.path.exists(self._path):
-            with open(self._path, 'w', encoding='utf-8') as f:
+        try:
+            with open(self._path, 'x', encoding='utf-8') as f:
                 f.write('{}')
+        except FileExistsError:
+            pass
 
     def load_task(self) -> dict[str, list[dict[str, object]]]:
         """Loads and returns the tasks dict from the JSON file."""
@@ -29,11 +34,13 @@ class JsonTaskRepository(BaseTaskRepository):
             content = f.read().strip()
         if not content:
             return {}
-        return json.loads(content)
+        return cast(
+            dict[str, list[dict[str, object]]], json_codec.loads(content)
+        )
 
     def save_task(self, tasks_raw: dict[str, list[dict[str, object]]]) -> None:
         """Saves the full tasks dict to the JSON file."""
         if self._path is None:
             return
         with open(self._path, 'w', encoding='utf-8') as f:
-            json.dump(tasks_raw, f, indent=4)
+            f.write(json_codec.dumps(tasks_raw))
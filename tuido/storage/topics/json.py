@@ -1,6 +1,7 @@
-import json
 import os
+from typing import cast
 from tuido.domain.errors import TopicsFileNotFoundError
+from tuido.storage import json_codec
 from tuido.storage.topics.base import BaseTopicRepository
 
 
@@ -26,11 +27,11 @@ class JsonTopicRepository(BaseTopicRepository):
         if self._path is None:
             return []
         with open(self._path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return cast(list[dict[str, object]], json_codec.loads(f.read()))
 
     def save_topics(self, topics: list[dict[str, object]]) -> None:
         """Saves the full list of topics to the JSON file."""
         if self._path is None:
             return
         with open(self._path, 'w', encoding='utf-8') as f:
-            json.dump(topics, f, indent=4)
+            f.write(json_codec.dumps(topics))
@@ -1,12 +1,14 @@
-import asyncio
 import logging
 from pathlib import Path
 from textual import work
 from textual.app import App
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import DataTable, Input, Select, TextArea
 from termz.tui.question_screen import QuestionScreen
 from termz.tui.theme_loader import ThemeLoader
 from tuido import APP_TITLE
+from tuido.domain.models import Task
 from tuido.services.config_service import ConfigService
 from tuido.services.notes_service import NotesService
 from tuido.services.tasks_service import TasksService
@@ -15,7 +17,9 @@ from tuido.tui.bindings import custom_bindings
 from tuido.tui.screens.main_screen import MainScreen
 from tuido.tui.screens.task_edit_screen import TaskEditScreen
 from tuido.tui.screens.tabs.tasks_tab import TasksTab
-from tuido.tui.screens.tabs.topics_tab import TopicsTab
+from tuido.tui.screens.tabs.topics_tab import (
+    TopicFormWidget, TopicsTab, is_topic_form_widget
+)
 
 
 _STATE_DIR       = Path.home() / '.local' / 'state' / 'tuido'
@@ -23,6 +27,7 @@ _STATE_DIR.mkdir(parents=True, exist_ok=True)
 THEME_CONFIG_FILE = _STATE_DIR / 'theme.json'
 THEMES_DIR        = str(Path(__file__).parent / 'themes')
 DEFAULT_THEME     = 'classic-black'
+COMPARE_DELAY     = 0.06  # seconds without typing before comparing a field
 theme_loader      = ThemeLoader(THEMES_DIR, include_standard_themes=True)
 
 
@@ -47,6 +52,8 @@ class TuidoApp(App[None]):
     _main_screen: MainScreen
     _task_action: str
     _index_of_edited_task: int
+    _task_delete_pending: bool
+    _pending_compares: dict[TopicFormWidget, Timer]
 
     def __init__(
         self,
@@ -62,6 +69,8 @@ class TuidoApp(App[None]):
         self.notes_service   = notes_service
         self._task_action    = 'new'
         self._index_of_edited_task = -1
+        self._task_delete_pending  = False
+        self._pending_compares     = {}
 
     def on_mount(self) -> None:
         """Register themes, set previous theme and push MainScreen."""
@@ -121,12 +130,10 @@ class TuidoApp(App[None]):
         theme_loader.change_to_next_or_previous_theme(-1, self)
 
     def action_previous_tab(self) -> None:
-        from textual.widgets import Tabs
-        self._main_screen.query_one('#main_tabs', Tabs).action_previous_tab()
+        self._main_screen.main_tabs.action_previous_tab()
 
     def action_next_tab(self) -> None:
-        from textual.widgets import Tabs
-        self._main_screen.query_one('#main_tabs', Tabs).action_next_tab()
+        self._main_screen.main_tabs.action_next_tab()
 
     # ------------------------------------------------------------------------ #
     #  Tasks actions                                                           #
@@ -138,11 +145,11 @@ class TuidoApp(App[None]):
     def action_tasks_edit(self) -> None:
         self._open_task_edit_screen('edit')
 
-    def action_tasks_move_left(self) -> None:
-        self._move_task(-1)
+    async def action_tasks_move_left(self) -> None:
+        await self._move_task(-1)
 
-    def action_tasks_move_right(self) -> None:
-        self._move_task(1)
+    async def action_tasks_move_right(self) -> None:
+        await self._move_task(1)
 
     def action_tasks_select_left_column(self) -> None:
         self._select_adjacent_column(-1)
@@ -158,29 +165,20 @@ class TuidoApp(App[None]):
 
     @work
     async def action_tasks_delete(self) -> None:
-        if await self.push_screen_wait(
-            QuestionScreen('Really delete the selected task?')
-        ):
-            tasks_tab = self._get_tasks_tab()
-            col   = tasks_tab.selected_column_name
-            index = tasks_tab.selected_task_index
-            self.tasks_service.delete_task(col, index)
-            tasks_tab.refresh_column(col)
-            new_len = len(self.tasks_service.get_tasks().get(col, []))
-            asyncio.get_event_loop().call_soon(
-                lambda: tasks_tab.select_task(
-                    col, min(index, max(new_len - 1, 0))
-                ) if new_len > 0 else None
-            )
-            self.notify('Task deleted!')
-        else:
-            self.notify('Deletion canceled.', severity='warning')
+        # Ignore repeated key presses while a deletion is already in progress
+        if self._task_delete_pending:
+            return
+        self._task_delete_pending = True
+        try:
+            await self._delete_selected_task()
+        finally:
+            self._task_delete_pending = False
 
-    def on_task_edit_screen_submit(
+    async def on_task_edit_screen_submit(
         self, message: TaskEditScreen.Submit
     ) -> None:
         """Handles task save from the edit screen."""
-        logging.info(f'on_task_edit_screen_submit: {message}')
+        logging.info('on_task_edit_screen_submit: %s', message)
         tasks_tab = self._get_tasks_tab()
         task_raw = {
             'description': message.description,
@@ -193,43 +191,41 @@ class TuidoApp(App[None]):
 
         if self._task_action == 'new':
             col = self.config_service.get_task_column_names()[0]
-            _task, idx = self.tasks_service.add_task(col, task_raw)
+            task, idx = self.tasks_service.add_task(col, task_raw)
+            tasks_tab.insert_list_item(col, idx, task)
         else:
             col   = tasks_tab.selected_column_name
             index = tasks_tab.selected_task_index
-            _task, idx = self.tasks_service.update_task(col, index, task_raw)
+            old_task = self.tasks_service.get_tasks()[col][index]
+            task, idx = self.tasks_service.update_task(col, index, task_raw)
+            if task is not old_task:
+                await tasks_tab.replace_list_item(col, index, idx, task)
 
-        tasks_tab.refresh_column(col)
         self._index_of_edited_task = idx
-
-        asyncio.get_event_loop().call_soon(
-            lambda: tasks_tab.select_task(col, idx)
-        )
-        self.call_later(lambda: tasks_tab.select_task(col, idx))
+        self.call_later(tasks_tab.select_task, col, idx)
 
     # ------------------------------------------------------------------------ #
     #  Topics actions                                                          #
     # ------------------------------------------------------------------------ #
 
     def action_topics_new(self) -> None:
+        self._flush_pending_compares()
         topics_tab = self._get_topics_tab()
-        if len(topics_tab.user_changed_inputs) > 0:
+        if topics_tab.has_user_changes():
             self.notify('Discard or save changes first.', severity='warning')
             return
         topics_tab.create_new_topic()
 
     def action_topics_focus_table(self) -> None:
-        table = self._main_screen.query_one('#topics_table', DataTable[str])
-        self.set_focus(table)
+        self.set_focus(self._get_topics_tab().topics_table)
         self.notify('Topics table focused!')
 
     def action_topics_save(self) -> None:
+        self._flush_pending_compares()
         topics_tab = self._get_topics_tab()
         topics_tab.save_topic()
-        for field in list(topics_tab.user_changed_inputs):
-            topics_tab.query_one(f'#{field}').remove_class('changed-input')
+        topics_tab.clear_user_changes()
         topics_tab.topics_table.disabled = False
-        topics_tab.user_changed_inputs.clear()
         self.notify('Topic updated!')
 
     @work
@@ -237,12 +233,11 @@ class TuidoApp(App[None]):
         if await self.push_screen_wait(
             QuestionScreen('Really discard changes?')
         ):
+            self._cancel_pending_compares()
             topics_tab = self._get_topics_tab()
             topics_tab.update_input_fields(called_from_discard=True)
-            for field in list(topics_tab.user_changed_inputs):
-                topics_tab.query_one(f'#{field}').remove_class('changed-input')
+            topics_tab.clear_user_changes()
             topics_tab.topics_table.disabled = False
-            topics_tab.user_changed_inputs.clear()
             self.notify('Changes discarded!')
         else:
             self.notify('Discard canceled.', severity='warning')
@@ -262,47 +257,26 @@ class TuidoApp(App[None]):
     # ------------------------------------------------------------------------ #
 
     def action_notes_show_textarea(self) -> None:
-        notes_tab = self._main_screen.notes_tab
-        notes_tab.query_one('#notes_textarea', TextArea).remove_class('hidden')
-        notes_tab.query_one('#notes_markdown').add_class('hidden')
+        self._main_screen.notes_tab.set_view(textarea=True, markdown=False)
 
     def action_notes_show_md(self) -> None:
-        notes_tab = self._main_screen.notes_tab
-        notes_tab.query_one('#notes_textarea', TextArea).add_class('hidden')
-        notes_tab.query_one('#notes_markdown').remove_class('hidden')
+        self._main_screen.notes_tab.set_view(textarea=False, markdown=True)
 
     def action_notes_show_textarea_and_md(self) -> None:
-        notes_tab = self._main_screen.notes_tab
-        notes_tab.query_one('#notes_textarea', TextArea).remove_class('hidden')
-        notes_tab.query_one('#notes_markdown').remove_class('hidden')
+        self._main_screen.notes_tab.set_view(textarea=True, markdown=True)
 
     # ------------------------------------------------------------------------ #
     #  Input-change tracking for topics (unchanged / changed highlighting)     #
     # ------------------------------------------------------------------------ #
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        input_name = event.input.id
-        topics_tab = self._get_topics_tab()
-        if input_name in topics_tab.programmatically_changed_inputs:
-            topics_tab.programmatically_changed_inputs.discard(input_name)
-            return
-        self._compare_input_to_original(event)
+        self._schedule_compare(event.input)
 
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        input_name = event.text_area.id
-        topics_tab = self._get_topics_tab()
-        if input_name in topics_tab.programmatically_changed_inputs:
-            topics_tab.programmatically_changed_inputs.discard(input_name)
-            return
-        self._compare_input_to_original(event)
+        self._schedule_compare(event.text_area)
 
     def on_select_changed(self, event: Select.Changed) -> None:
-        input_name = event.select.id
-        topics_tab = self._get_topics_tab()
-        if input_name in topics_tab.programmatically_changed_inputs:
-            topics_tab.programmatically_changed_inputs.discard(input_name)
-            return
-        self._compare_input_to_original(event)
+        self._schedule_compare(event.select)
 
     def on_data_table_row_highlighted(
         self, _event: DataTable.RowHighlighted
@@ -311,48 +285,72 @@ class TuidoApp(App[None]):
         topics_tab.update_input_fields()
         topics_tab.app_startup = False
 
-    def _compare_input_to_original(
-        self, event: Input.Changed | TextArea.Changed | Select.Changed
-    ) -> None:
-        if isinstance(event, Input.Changed):
-            widget      = event.input
-            current_val = widget.value
-        elif isinstance(event, TextArea.Changed):
-            widget      = event.text_area
-            current_val = widget.text
-        elif isinstance(event, Select.Changed):  # type: ignore
-            widget      = event.select
-            current_val = widget.value
-        # else:
-        #     return
-
-        if widget.id is None or not widget.id.startswith('topics_'):
+    def _schedule_compare(self, widget: Widget) -> None:
+        """
+        Schedules the comparison of a topics form widget with the saved value.
+
+        Change events caused by writing a value programmatically are dropped
+        right away. For user edits, a pending comparison of the same widget is
+        restarted, so a burst of keystrokes leads to a single comparison once
+        typing pauses for `COMPARE_DELAY` seconds.
+        """
+        if not is_topic_form_widget(widget):
+            return
+        if self._get_topics_tab().consume_programmatic_change(widget):
             return
 
-        if current_val is Select.NULL:
-            current_val = ''
+        timer = self._pending_compares.pop(widget, None)
+        if timer is not None:
+            timer.stop()
+        self._pending_compares[widget] = self.set_timer(
+            COMPARE_DELAY, lambda: self._run_pending_compare(widget)
+        )
 
-        topics_tab = self._get_topics_tab()
-        topic_id   = topics_tab.topics_table.get_current_id()
-        field_name = widget.id.replace('topics_', '').replace('_input', '')
+    def _run_pending_compare(self, widget: TopicFormWidget) -> None:
+        if self._pending_compares.pop(widget, None) is not None:
+            self._compare_input_to_original(widget)
+
+    def _flush_pending_compares(self) -> None:
+        """
+        Runs all scheduled comparisons immediately. Called before the change
+        flags are evaluated, so an edit made right before saving isn't lost.
+        """
+        pending, self._pending_compares = self._pending_compares, {}
+        for widget, timer in pending.items():
+            timer.stop()
+            self._compare_input_to_original(widget)
 
+    def _cancel_pending_compares(self) -> None:
+        for timer in self._pending_compares.values():
+            timer.stop()
+        self._pending_compares.clear()
+
+    def _compare_input_to_original(self, widget: TopicFormWidget) -> None:
+        """
+        Flags a topics form widget as changed if its current value differs
+        from the saved one.
+        """
+        topics_tab   = self._get_topics_tab()
+        current_val  = topics_tab.read_input(widget)
+        topic_id     = topics_tab.get_current_topic_id()
         row_data     = self.topics_service.get_topic_by_id(topic_id)
-        original_val = str(row_data.get(field_name, ''))
+        original_val = str(row_data.get(widget.field_name, ''))
 
-        if current_val == original_val:
-            widget.remove_class('changed-input')
-            topics_tab.user_changed_inputs.discard(widget.id)
-        else:
-            widget.add_class('changed-input')
-            topics_tab.user_changed_inputs.add(widget.id)
+        topics_tab.set_user_changed(widget, current_val != original_val)
 
         self._update_topics_table_state()
 
     def _update_topics_table_state(self) -> None:
+        """
+        Disables the topics table while the form has unsaved changes. The
+        reactive is only written when the state actually flips, since most
+        keystrokes leave it unchanged.
+        """
         topics_tab = self._get_topics_tab()
-        topics_tab.topics_table.disabled = (
-            len(topics_tab.user_changed_inputs) > 0
-        )
+        table      = topics_tab.topics_table
+        disabled   = topics_tab.has_user_changes()
+        if table.disabled != disabled:
+            table.disabled = disabled
 
     # ------------------------------------------------------------------------ #
     #  Private helpers                                                         #
@@ -369,45 +367,64 @@ class TuidoApp(App[None]):
         self._task_action = action
         tasks_tab = self._get_tasks_tab()
 
-        focused_col: str | None = None
-        for col, lv in tasks_tab.list_views.items():
-            if lv.has_focus:
-                focused_col = col
-                break
-
-        if focused_col is None and action == 'edit':
-            return
+        task: Task | None = None
+        if action == 'edit':
+            col   = tasks_tab.selected_column_name
+            index = tasks_tab.selected_task_index
+            tasks = self.tasks_service.get_tasks().get(col, [])
+            if not 0 <= index < len(tasks):
+                return
+            task = tasks[index]
 
         screen = TaskEditScreen(tasks_tab.list_views)
         self.push_screen(screen)
 
-        if action == 'edit':
+        if task is not None:
+            screen.set_input_values(task)
+
+    async def _delete_selected_task(self) -> None:
+        """Deletes the selected task after the user has confirmed it."""
+        if await self.push_screen_wait(
+            QuestionScreen('Really delete the selected task?')
+        ):
+            tasks_tab = self._get_tasks_tab()
+            tasks_service = self.tasks_service
             col   = tasks_tab.selected_column_name
             index = tasks_tab.selected_task_index
-            task  = self.tasks_service.get_tasks()[col][index]
-            screen.set_input_values(task)
+            tasks_service.delete_task(col, index)
+            await tasks_tab.remove_list_item(col, index)
+            new_len = len(tasks_service.get_tasks().get(col, []))
+            if new_len > 0:
+                self.call_later(
+                    tasks_tab.select_task, col, min(index, new_len - 1)
+                )
+            self.notify('Task deleted!')
+        else:
+            self.notify('Deletion canceled.', severity='warning')
 
-    def _move_task(self, direction: int) -> None:
+    async def _move_task(self, direction: int) -> None:
         """Moves the selected task left (direction=-1) or right (+1)."""
-        tasks_tab    = self._get_tasks_tab()
-        col_names    = self.config_service.get_task_column_names()
-        source_col   = tasks_tab.selected_column_name
-        source_index = col_names.index(source_col)
-        target_index = max(0, min(source_index + direction, len(col_names) - 1))
+        tasks_tab     = self._get_tasks_tab()
+        tasks_service = self.tasks_service
+        col_names     = tasks_service.get_column_names()
+        source_col    = tasks_tab.selected_column_name
+        source_index  = tasks_service.get_column_index(source_col)
+        last_index    = len(col_names) - 1
+        target_index  = max(0, min(source_index + direction, last_index))
 
         if source_index == target_index:
             return
-        if not self.tasks_service.get_tasks().get(source_col):
+        if not tasks_service.get_tasks().get(source_col):
             return
 
         target_col = col_names[target_index]
         task_index = tasks_tab.selected_task_index
-        _task, new_idx = self.tasks_service.move_task(
+        task, new_idx = tasks_service.move_task(
             source_col, task_index, target_col
         )
 
-        tasks_tab.refresh_column(source_col)
-        tasks_tab.refresh_column(target_col)
+        await tasks_tab.remove_list_item(source_col, task_index)
+        tasks_tab.insert_list_item(target_col, new_idx, task)
 
         lv = tasks_tab.list_views[target_col]
         lv.index = new_idx
@@ -415,31 +432,24 @@ class TuidoApp(App[None]):
 
     def _select_adjacent_column(self, direction: int) -> None:
         """Moves focus to the nearest non-empty column."""
-        from termz.util.index import next_index
-
-        tasks_tab   = self._get_tasks_tab()
-        list_views  = tasks_tab.list_views
-        col_names   = self.config_service.get_task_column_names()
-
-        if all(len(list_views[c].children) == 0 for c in col_names):
-            return
-
-        current_col   = tasks_tab.selected_column_name
-        current_index = col_names.index(current_col)
+        tasks_tab     = self._get_tasks_tab()
+        list_views    = tasks_tab.list_views
+        col_names     = self.tasks_service.get_column_names()
+        col_count     = len(col_names)
+        current_index = self.tasks_service.get_column_index(
+            tasks_tab.selected_column_name
+        )
 
-        while True:
-            current_index = next_index(
-                current_index, len(col_names), direction
-            )
-            col = col_names[current_index]
-            if len(list_views[col].children) > 0:
+        # Visit every column once, starting next to the current one and
+        # wrapping around (ending at the current column itself)
+        for step in range(1, col_count + 1):
+            col = col_names[(current_index + direction * step) % col_count]
+            if list_views[col].children:
                 list_views[col].focus()
-                break
+                return
 
     def _select_adjacent_task(self, direction: int) -> None:
         """Selects the task above (direction=-1) or below (+1)."""
-        from termz.util.index import next_index  # type: ignore
-
         tasks_tab = self._get_tasks_tab()
         col       = tasks_tab.selected_column_name
         index     = tasks_tab.selected_task_index
@@ -448,6 +458,6 @@ class TuidoApp(App[None]):
         if length == 0:
             return
 
-        new_index = next_index(index, length, direction)
+        new_index = (index + direction) % length
         self._index_of_edited_task = new_index
         tasks_tab.select_task(col, new_index)
@@ -2,7 +2,7 @@ from textual.app import ComposeResult
 from textual.containers import Container
 from textual.reactive import reactive
 from textual.screen import Screen
-from textual.widgets import Header, Tabs, Tab
+from textual.widgets import Header, Static, Tabs, Tab
 from termz.io.app_state_storage import AppStateStorage
 from termz.tui.custom_widgets.multiline_footer import MultiLineFooter
 from tuido import APP_ICON
@@ -28,6 +28,7 @@ class MainScreen(Screen[None]):
     CSS_PATH = [
         'tabs/tasks_tab.tcss', 'tabs/topics_tab.tcss', 'tabs/notes_tab.tcss'
     ]
+    NOTES_PREFETCH_DELAY: float = 0.5
 
     _config: ConfigService
     _tasks_service: TasksService
@@ -37,9 +38,11 @@ class MainScreen(Screen[None]):
 
     current_tab_name = reactive('tasks', bindings=True)
 
+    main_tabs: Tabs
     tasks_tab: TasksTab
     topics_tab: TopicsTab
     notes_tab: NotesTab
+    _tab_contents: dict[str, Static]
 
 
     def __init__(
@@ -51,23 +54,29 @@ class MainScreen(Screen[None]):
     ) -> None:
         super().__init__()
         self._config    = config
+        self._app_state = AppStateStorage()
         self.tasks_tab  = TasksTab(tasks_service, id='tasks-tab')
         self.topics_tab = TopicsTab(config, topics_service, id='topics-tab',
                                     classes='hidden')
         self.notes_tab  = NotesTab(notes_service, id='notes-tab',
                                    classes='hidden')
-
-    def compose(self) -> ComposeResult:
-        yield Header(icon=APP_ICON)
-        tabs = Tabs(
+        self.main_tabs  = Tabs(
             Tab('Tasks',  id='tasks'),
             Tab('Topics', id='topics'),
             Tab('Notes',  id='notes'),
             id='main_tabs',
         )
-        tabs.can_focus = False
+        self.main_tabs.can_focus = False
+        self._tab_contents = {
+            'tasks':  self.tasks_tab,
+            'topics': self.topics_tab,
+            'notes':  self.notes_tab,
+        }
+
+    def compose(self) -> ComposeResult:
+        yield Header(icon=APP_ICON)
         with Container():
-            yield tabs
+            yield self.main_tabs
             yield self.tasks_tab
             yield self.topics_tab
             yield self.notes_tab
@@ -78,18 +87,24 @@ class MainScreen(Screen[None]):
         )
 
     def on_mount(self) -> None:
-        """Initializes the topics table after all widgets are mounted."""
+        """
+        Initializes the topics table after all widgets are mounted and
+        schedules loading the notes shortly after the first paint, so the
+        notes tab is already filled when it is opened for the first time.
+        """
         self.topics_tab.initialize_table()
         self.tasks_tab.set_can_focus()
-        last_tab = str(AppStateStorage().get('last_tab', 'tasks'))
-        self.query_one('#main_tabs', Tabs).active = last_tab
+        last_tab = str(self._app_state.get('last_tab', 'tasks'))
+        self.main_tabs.active = last_tab
+        self.set_timer(self.NOTES_PREFETCH_DELAY, self.notes_tab.load_notes)
 
     def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Shows the activated tab and hide the others."""
         if event.tab.id is None:
             return
-        for tab_id in ('tasks', 'topics', 'notes'):
-            self.query_one(f'#{tab_id}-tab').add_class('hidden')
-        self.query_one(f'#{event.tab.id}-tab').remove_class('hidden')
+        for tab_id, content in self._tab_contents.items():
+            content.set_class(tab_id != event.tab.id, 'hidden')
+        if event.tab.id == 'notes':
+            self.notes_tab.load_notes()
         self.current_tab_name = event.tab.id
-        AppStateStorage().set('last_tab', event.tab.id)
+        self._app_state.set('last_tab', event.tab.id)
@@ -1,7 +1,7 @@
-import threading
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Grid
+from textual.timer import Timer
 from textual.widgets import Static, TextArea, Markdown
 from tuido.services.notes_service import NotesService
 
@@ -11,9 +11,20 @@ class NotesTab(Static):
     Notes tab - side-by-side Markdown textarea and rendered preview.
 
     Receives a `NotesService` and wires the TextArea change event to
-    the service's throttle/debounce auto-save logic.
+    the service's debounced auto-save logic. Change events are coalesced so
+    that the service is updated at most once per `FLUSH_INTERVAL` seconds.
+    The markdown preview, which parses the whole text, is only rendered once
+    typing has paused for `MARKDOWN_DELAY` seconds. The saved notes are
+    loaded into the textarea after startup (see `MainScreen.on_mount`) or when
+    the tab is shown, whichever comes first.
     """
+    FLUSH_INTERVAL: float = 1 / 30
+    MARKDOWN_DELAY: float = 0.15
+
     _service: NotesService
+    _pending_text: str | None
+    _markdown_timer: Timer | None
+    _notes_loaded: bool
     textarea: TextArea
     markdown: Markdown
 
@@ -22,6 +33,9 @@ class NotesTab(Static):
         """Initializes the `NotesTab` with the provided `NotesService`."""
         super().__init__(**kwargs)  # type:ignore[reportMissingParameterType]
         self._service = service
+        self._pending_text = None
+        self._markdown_timer = None
+        self._notes_loaded = False
         self.textarea = TextArea(
             id='notes_textarea',
             classes='notes-textarea',
@@ -31,21 +45,63 @@ class NotesTab(Static):
         self.textarea.indent_width = 4
         self.markdown = Markdown(id='notes_markdown', classes='notes-markdown')
 
-    def on_mount(self) -> None:
-        """Populates the textarea with saved notes on mount."""
-        self.textarea.text = self._service.get_notes()
-
     def compose(self) -> ComposeResult:
         with Grid():
             yield self.textarea
             yield self.markdown
 
+    def on_unmount(self) -> None:
+        """
+        Hands text typed since the last flush to the service when the app
+        shuts down, so the service's exit flush can save it.
+        """
+        self._flush_pending_text()
+
+    def load_notes(self) -> None:
+        """
+        Populates the textarea with the saved notes if that hasn't happened
+        yet. Filling the textarea also renders the markdown preview, so this
+        is kept out of the first paint instead of being done on mount.
+        """
+        if self._notes_loaded:
+            return
+        self._notes_loaded = True
+        self.textarea.text = self._service.get_notes()
+
+    def set_view(self, textarea: bool, markdown: bool) -> None:
+        """Shows or hides the textarea and the markdown preview."""
+        self.textarea.set_class(not textarea, 'hidden')
+        self.markdown.set_class(not markdown, 'hidden')
+
     @on(TextArea.Changed)
-    async def update_markdown(self, event: TextArea.Changed) -> None:
-        """Syncs the markdown preview and trigger auto-save."""
-        await self.query_one('#notes_markdown').update(event.text_area.text)  # type: ignore
-        threading.Thread(
-            target=self._service.on_text_changed,
-            args=(event.text_area.text,),
-            daemon=True,
-        ).start()
+    def update_markdown(self, event: TextArea.Changed) -> None:
+        """
+        Stores the latest text and schedules a flush if none is pending yet.
+        The pending markdown render is restarted on every change.
+        """
+        flush_scheduled = self._pending_text is not None
+        self._pending_text = event.text_area.text
+        if not flush_scheduled:
+            self.set_timer(self.FLUSH_INTERVAL, self._flush_pending_text)
+        if self._markdown_timer is not None:
+            self._markdown_timer.stop()
+        self._markdown_timer = self.set_timer(
+            self.MARKDOWN_DELAY, self._render_markdown
+        )
+
+    async def _render_markdown(self) -> None:
+        """Renders the current text in the markdown preview."""
+        self._markdown_timer = None
+        await self.markdown.update(self.textarea.text)
+
+    def _flush_pending_text(self) -> None:
+        """
+        Triggers auto-save with the latest text. `on_text_changed` only moves
+        the service's debounce deadline and never writes, so it is called
+        directly instead of from a new thread.
+        """
+        text = self._pending_text
+        self._pending_text = None
+        if text is None:
+            return
+        self._service.on_text_changed(text)
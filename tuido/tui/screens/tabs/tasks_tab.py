@@ -2,23 +2,43 @@ from __future__ import annotations
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.events import Key, Focus, Blur
+from textual.widget import Widget
 from textual.widgets import Static, ListView, ListItem, Label
 from rich.text import Text
-from termz.util.index import next_index  # type: ignore
 from tuido.domain.models import Task, TaskPriority
 from tuido.services.tasks_service import TasksService
 
 
+# CSS class of a task list item per priority
+_PRIORITY_CLASSES = {
+    TaskPriority.HIGH:   'task_prio_high',
+    TaskPriority.MEDIUM: 'task_prio_medium',
+    TaskPriority.LOW:    'task_prio_low',
+    TaskPriority.NONE:   'task_prio_none',
+}
+
+
 class CustomListView(ListView):
     """
     ListView that scrolls the parent VerticalScroll instead of itself.
 
     This is a workaround for a ListView scrolling issue in this layout.
+
+    The item with the `selected` class is tracked, so moving the selection
+    only touches the previously selected and the newly selected item. The
+    class is kept when the list loses focus; the stylesheet only highlights
+    selected items of the focused list (`ListView:focus`). While
+    an arrow key is held, scrolling and moving the class are coalesced to at
+    most one update per `SELECTION_UPDATE_INTERVAL` seconds.
     """
+    SELECTION_UPDATE_INTERVAL: float = 1 / 60
+
     vertical_scroll: VerticalScroll
     tasks_tab: TasksTab
     column_name: str
     loop_behavior: bool
+    _selected_item: Widget | None
+    _pending_index: int | None
 
 
     def __init__(
@@ -40,6 +60,8 @@ class CustomListView(ListView):
         self.tasks_tab = tasks_tab
         self.column_name = column_name
         self.loop_behavior = loop_behavior
+        self._selected_item = None
+        self._pending_index = None
 
     async def on_key(self, event: Key) -> None:
         """
@@ -47,85 +69,123 @@ class CustomListView(ListView):
         behavior if enabled and scrolls the parent VerticalScroll to the
         selected item.
         """
-        loop_applied = self._enable_loop_behavior(event)
-        self._scroll_to_selected_item(event, loop_applied)
+        if event.key not in ('up', 'down'):
+            return
+        item_count = len(self.children)
+        loop_applied = self._enable_loop_behavior(event, item_count)
+        self._scroll_to_selected_item(event, loop_applied, item_count)
 
-    def _enable_loop_behavior(self, event: Key) -> bool:
+    def _enable_loop_behavior(self, event: Key, item_count: int) -> bool:
         """Enables loop behavior for up/down keys if configured."""
-        if not self.loop_behavior or event.key not in ('up', 'down'):
+        if not self.loop_behavior:
             return False
         current_index = self.index or 0
-        list_bounds = (0, len(self.children) - 1)
-        if current_index not in list_bounds:
+        if current_index not in (0, item_count - 1):
             return False
+        # Only reached at the first/last item, where the step wraps around
         direction = -1 if event.key == 'up' else 1
-        new_index = next_index(
-            current_index,
-            len(self.children),
-            direction=direction,
-            loop_behavior=self.loop_behavior,
-        )
-        self.index = new_index
+        self.index = (current_index + direction) % item_count
         event.stop()
         return True
 
     def _scroll_to_selected_item(
-        self, event: Key, loop_applied: bool
+        self, event: Key, loop_applied: bool, item_count: int
     ) -> None:
         """
         Scrolls the parent `VerticalScroll` to the selected item after handling
         the key event, applying loop behavior if enabled.
+
+        The `TasksTab`'s selection is updated right away; the scrolling and
+        the class change are scheduled unless an update is already pending.
         """
         index = self.index or 0
-        if event.key not in ('up', 'down'):
-            return
         if not loop_applied:
             if event.key == 'up':
                 index = max(0, index - 1)
-            elif event.key == 'down':
-                index = min(len(self.children) - 1, index + 1)
-        item = self.children[index]
-        self.vertical_scroll.scroll_to_widget(item)
-        self._change_class(index)
+            else:
+                index = min(item_count - 1, index + 1)
         self.tasks_tab.selected_column_name = self.column_name
         self.tasks_tab.selected_task_index = index
 
+        update_scheduled = self._pending_index is not None
+        self._pending_index = index
+        if not update_scheduled:
+            self.set_timer(
+                self.SELECTION_UPDATE_INTERVAL, self._flush_pending_selection
+            )
+
+    def _flush_pending_selection(self) -> None:
+        """
+        Scrolls to the item at the pending index and marks it as selected.
+        Does nothing if the selection has been set otherwise in the meantime
+        or if the item is already the selected one (e.g. the key didn't move
+        the selection), since it has been scrolled into view then.
+        """
+        index = self._pending_index
+        self._pending_index = None
+        children = self.children
+        if index is None or not 0 <= index < len(children):
+            return
+        item = children[index]
+        if item is self._selected_item:
+            return
+        self.vertical_scroll.scroll_to_widget(item)
+        self._set_selected_item(item)
+
     def _change_class(self, index: int) -> None:
         """
         Adds `selected` class to the item at the given index and removes it
-        from all other items.
+        from the previously selected item.
         """
-        for i, item in enumerate(self.children):
-            if isinstance(item, ListItem):
-                if i == index:
-                    item.add_class('selected')
-                else:
-                    item.remove_class('selected')
+        children = self.children
+        if 0 <= index < len(children):
+            self._set_selected_item(children[index])
+        else:
+            self._set_selected_item(None)
+
+    def _set_selected_item(self, item: Widget | None) -> None:
+        """Moves the `selected` class from the tracked item to `item`."""
+        previous = self._selected_item
+        if previous is item:
+            return
+        if previous is not None:
+            previous.remove_class('selected')
+        if item is not None:
+            item.add_class('selected')
+        self._selected_item = item
 
     def on_focus(self, _event: Focus) -> None:
         """
         Adds `selected` class to the currently selected item on focus and
         updates the `TasksTab`'s selected column and task index.
         """
-        for item in self.children:
-            item.remove_class('selected')
+        self.select_current_item()
+
+    def select_current_item(self) -> None:
+        """
+        Adds `selected` class to the item at the current index, removes it from
+        the previously selected item and updates the `TasksTab`'s selected
+        column and task index.
+        """
+        self._pending_index = None
         self._change_class(self.index or 0)
         self.tasks_tab.selected_column_name = self.column_name
         self.tasks_tab.selected_task_index = self.index or 0
 
     def on_blur(self, _event: Blur) -> None:
-        """Removes `selected` class from all items on blur. """
-        for item in self.children:
-            item.remove_class('selected')
+        """
+        Drops a pending selection update on blur. The `selected` class stays
+        on the item; it is only styled while the list has focus.
+        """
+        self._pending_index = None
 
     async def on_list_view_selected(self, event: ListView.Selected) -> None:
         """
         Adds `selected` class to the selected item and updates the `TasksTab`'s
         selected column and task index.
         """
-        for item in self.children:
-            item.remove_class('selected')
-        event.item.add_class('selected')
+        self._pending_index = None
+        self._set_selected_item(event.item)
         self.tasks_tab.selected_column_name = self.column_name
         self.tasks_tab.selected_task_index = self.index or 0
 
@@ -136,13 +196,14 @@ class TasksTab(Static):
 
     Receives a TasksService and uses it to populate the columns on composition.
     All mutations (add/edit/delete/move) are triggered via TuidoApp action
-    methods that call the service and then call `refresh_column`/`select_task`
-    on this widget.
+    methods that call the service and then update the affected list items
+    (`insert_list_item`/`remove_list_item`/`replace_list_item`) and call
+    `select_task` on this widget.
     """
 
     _service: TasksService
     list_views: dict[str, CustomListView]
-    column_names: list[str]
+    column_names: tuple[str, ...]
     column_captions: dict[str, str]
     tasks: dict[str, list[Task]]
     selected_column_name: str
@@ -153,7 +214,7 @@ class TasksTab(Static):
         super().__init__(**kwargs)  # type:ignore[reportMissingParameterType]
         self._service = service
         self.list_views = {}
-        self.column_names = service.get_column_names()
+        self.column_names = tuple(service.get_column_names())
         self.column_captions = service.get_column_captions()
         self.tasks = service.get_tasks()
         # Default selection
@@ -189,57 +250,96 @@ class TasksTab(Static):
     def create_list_items(self, column_name: str) -> list[ListItem]:
         """
         Creates a list of `ListItem` widgets for the given column name based on
-        the tasks in that column, including start/end date info and priority
-        styling.
+        the tasks in that column.
         """
-        list_items: list[ListItem] = []
         if column_name not in self.tasks:
-            return list_items
-
-        for task in self.tasks[column_name]:
-            start_text, start_style = self._start_date_text_style(task)
-            end_text, end_style     = self._end_date_text_style(task)
-
-            list_item = ListItem(
-                Static(Text(task.description, style='bold')),
-                *([Static()] if start_text is not None \
-                             or end_text is not None else []),
-                *([Static(Text('▶ ' + start_text, style=start_style))]
-                  if start_text is not None else []),
-                *([Static(Text('◼ ' + end_text, style=end_style))]
-                  if end_text is not None else []),
+            return []
+        return [
+            self._create_list_item(task) for task in self.tasks[column_name]
+        ]
+
+    def _create_list_item(self, task: Task) -> ListItem:
+        """
+        Creates a `ListItem` widget for the given task, including start/end
+        date info and priority styling. The children are collected in a
+        single list and the priority class is passed to the constructor.
+        """
+        start_text, start_style = self._start_date_text_style(task)
+        end_text, end_style     = self._end_date_text_style(task)
+
+        children: list[Widget] = [Static(Text(task.description, style='bold'))]
+        if start_text is not None or end_text is not None:
+            children.append(Static())
+        if start_text is not None:
+            children.append(
+                Static(Text('▶ ' + start_text, style=start_style))
             )
-            self._set_priority_class(list_item, task)
-            list_items.append(list_item)
-
-        return list_items
-
-    def refresh_column(self, column_name: str) -> None:
-        """Recreates the list view for the given column from service data."""
-        self.tasks = self._service.get_tasks()
-        list_view: ListView = self.list_views[column_name]
-        list_view.clear()
-        for item in self.create_list_items(column_name):
-            list_view.append(item)
+        if end_text is not None:
+            children.append(Static(Text('◼ ' + end_text, style=end_style)))
+
+        return ListItem(*children, classes=_PRIORITY_CLASSES[task.priority])
+
+    def insert_list_item(
+        self, column_name: str, index: int, task: Task
+    ) -> None:
+        """
+        Inserts a list item for the given task at the given index of the
+        column without rebuilding the other items.
+        """
+        self.list_views[column_name].insert(
+            index, [self._create_list_item(task)]
+        )
+        self.set_can_focus()
+
+    async def remove_list_item(self, column_name: str, index: int) -> None:
+        """
+        Removes the list item at the given index of the column without
+        rebuilding the other items. The removal is awaited, so the list's
+        children are up to date when an item is selected afterwards.
+        """
+        children = self.list_views[column_name].children
+        if 0 <= index < len(children):
+            await children[index].remove()
+        self.set_can_focus()
+
+    async def replace_list_item(
+        self, column_name: str, old_index: int, new_index: int, task: Task
+    ) -> None:
+        """
+        Replaces the list item at `old_index` with a new item for the given
+        task at `new_index` (the index after the old item has been removed).
+
+        The new item is mounted relative to its future neighbour, before the
+        old item is removed. The removal is awaited, so the list's children
+        are up to date when an item is selected afterwards.
+        """
+        list_view = self.list_views[column_name]
+        items = list(list_view.children)
+        old_item = items.pop(old_index)
+        new_item = self._create_list_item(task)
+        if new_index < len(items):
+            list_view.mount(new_item, before=items[new_index])
+        else:
+            list_view.mount(new_item)
+        await old_item.remove()
         self.set_can_focus()
 
     def select_task(self, column_name: str, index: int) -> None:
         """Focuses the given column's list view and select the given index."""
         list_view = self.list_views[column_name]
-        # Toggle focus to ensure on_focus fires
-        list_view.can_focus = False
-        list_view.disabled = True
-        list_view.can_focus = True
-        list_view.disabled = False
         list_view.index = index
-        list_view.focus()
-        list_view.refresh()
+        if list_view.has_focus:
+            # on_focus doesn't fire again, so update the selection directly
+            list_view.select_current_item()
+        else:
+            list_view.can_focus = True
+            list_view.focus()
 
     def set_can_focus(self) -> None:
         """Enables/disables list view focus depending on whether it has items."""
+        tasks, list_views = self.tasks, self.list_views
         for col in self.column_names:
-            has_items = col in self.tasks and len(self.tasks[col]) > 0
-            self.list_views[col].can_focus = has_items
+            list_views[col].can_focus = bool(tasks.get(col))
 
     # ------------------------------------------------------------------------ #
     #  Date helpers                                                            #
@@ -255,15 +355,16 @@ class TasksTab(Static):
         - Red: Overdue and past the end date (days to start < 0 and days to
           end < 0)
         """
-        if not task.start_date:
+        start_date = task.start_date
+        if not start_date:
             return None, ''
-        text = f'{task.start_date} ({task.days_to_start} d)'
         d = task.days_to_start
+        text = f'{start_date} ({d} d)'
         if d is None or d > 0:
             style = 'green'
-        elif (task.end_date and d < 0
-              and task.days_to_end is not None
-              and task.days_to_end < 0):
+        elif (d < 0 and task.end_date
+              and (days_to_end := task.days_to_end) is not None
+              and days_to_end < 0):
             style = 'red'
         else:
             style = 'yellow'
@@ -277,10 +378,11 @@ class TasksTab(Static):
         - Yellow: Due today (days to end == 0)
         - Red: Overdue (days to end < 0)
         """
-        if not task.end_date:
+        end_date = task.end_date
+        if not end_date:
             return None, ''
-        text = f'{task.end_date} ({task.days_to_end} d)'
         d = task.days_to_end
+        text = f'{end_date} ({d} d)'
         if d is None or d > 0:
             style = 'green'
         elif d == 0:
@@ -288,19 +390,3 @@ class TasksTab(Static):
         else:
             style = 'red'
         return text, style
-
-    @staticmethod
-    def _set_priority_class(item: ListItem, task: Task) -> None:
-        """Adds a CSS class to the item based on the task's priority."""
-        match task.priority:
-            case TaskPriority.HIGH:
-                item.add_class('task_prio_high')
-
-            case TaskPriority.MEDIUM:
-                item.add_class('task_prio_medium')
-
-            case TaskPriority.LOW:
-                item.add_class('task_prio_low')
-
-            case _:
-                item.add_class('task_prio_none')
@@ -1,7 +1,11 @@
 import logging
-from typing import cast
-from textual.app import ComposeResult
+from collections.abc import Callable
+from typing import TypeGuard, cast
+from textual.app import App, ComposeResult
 from textual.containers import HorizontalGroup, VerticalGroup, VerticalScroll
+from textual.coordinate import Coordinate
+from textual.widget import Widget
+from textual.widgets.select import InvalidSelectValueError
 from textual.widgets import Static, Input, Label, Select, TextArea
 from rich.text import Text
 from termz.tui.custom_widgets.custom_data_table import CustomDataTable
@@ -10,6 +14,97 @@ from tuido.services.config_service import ConfigService
 from tuido.services.topics_service import TopicsService
 
 
+InputReader = Callable[[Widget], str]
+InputWriter = Callable[[Widget, str], None]
+
+
+# Value accessors of the topics form widgets, chosen per field by `TopicsTab`
+
+def _read_input(widget: Widget) -> str:
+    return cast(Input, widget).value
+
+
+def _write_input(widget: Widget, value: str) -> None:
+    cast(Input, widget).value = value
+
+
+def _read_textarea(widget: Widget) -> str:
+    return cast(TextArea, widget).text
+
+
+def _write_textarea(widget: Widget, value: str) -> None:
+    cast(TextArea, widget).text = value
+
+
+def _read_select(widget: Widget) -> str:
+    value = cast(Select[str], widget).value
+    return '' if value is Select.NULL else str(value)
+
+
+def _write_select(widget: Widget, value: str) -> None:
+    select = cast(Select[str], widget)
+    if value == '':
+        select.clear()
+    else:
+        select.value = value
+
+
+class TopicIdCell(Text):
+    """
+    Right-aligned ID cell of the topics table that also keeps the integer ID,
+    so it doesn't have to be parsed back from the cell text.
+    """
+    __slots__ = ('topic_id',)
+
+    topic_id: int
+
+
+    def __init__(self, topic_id: int) -> None:
+        super().__init__(str(topic_id), justify='right')
+        self.topic_id = topic_id
+
+
+class TopicFormField:
+    """
+    Mixin for the topics form widgets that keeps the change-tracking state on
+    the widget itself.
+
+    Attributes
+    ----------
+    field_name : str
+        Name of the topic field edited by the widget.
+    programmatic_change : bool
+        Set when the program wrote the value, so the resulting change event
+        is not treated as a user edit.
+    user_changed : bool
+        Set while the value entered by the user differs from the saved one.
+    """
+    field_name: str = ''
+    programmatic_change: bool = False
+    user_changed: bool = False
+
+
+class TopicInput(Input, TopicFormField):
+    """Single-line input of the topics form."""
+
+
+class TopicTextArea(TextArea, TopicFormField):
+    """Multi-line input of the topics form."""
+
+
+class TopicSelect(Select[str], TopicFormField):
+    """Dropdown of the topics form."""
+
+
+# Form widgets carrying the `TopicFormField` state
+TopicFormWidget = TopicInput | TopicTextArea | TopicSelect
+
+
+def is_topic_form_widget(widget: Widget) -> TypeGuard[TopicFormWidget]:
+    """Returns whether `widget` is one of the topics form widgets."""
+    return isinstance(widget, TopicFormField)
+
+
 class TopicsDataTable(CustomDataTable[Text]):
     """DataTable for the topics list with row-cursor and ID helper."""
 
@@ -24,10 +119,24 @@ class TopicsDataTable(CustomDataTable[Text]):
     def get_current_id(self) -> int:
         """
         Retrieves the ID of the currently selected topic based on the position
-        of the row cursor.
+        of the row cursor. Only the ID cell is looked up, and its integer ID is
+        used directly unless the cell is a plain `Text`.
+        """
+        return self._cell_id(self.get_cell_at(Coordinate(self.cursor_row, 0)))
+
+    def sort_by_id(self) -> None:
         """
-        selected_row = self.get_row_at(self.cursor_row)
-        cell = selected_row[0]
+        Sorts the rows by ID in descending order. The rows are added in that
+        order, so after adding a new topic only its row is out of place,
+        which the sort handles in linear time.
+        """
+        self.sort('id', key=self._cell_id, reverse=True)
+
+    @staticmethod
+    def _cell_id(cell: Text) -> int:
+        """Returns the topic ID shown in an ID cell."""
+        if isinstance(cell, TopicIdCell):
+            return cell.topic_id
         return int(cell.plain.strip())
 
 
@@ -46,86 +155,95 @@ class TopicFormWidgets(VerticalGroup):
         self._config = config
 
     def compose(self) -> ComposeResult:
+        # The rows only provide the layout, the fields are taken from the
+        # parsed field definitions. Rows with a single field don't need a
+        # horizontal container.
+        fields = self._config.get_columns_dict()
         for form_row in self._config.get_fields():
+            row = [fields[str(form_col['name'])] for form_col in form_row]
+            if len(row) == 1:
+                yield self._create_form_element(row[0])
+                continue
             with HorizontalGroup():
-                for form_col in form_row:
-                    yield self._create_form_element(form_col)
+                for field in row:
+                    yield self._create_form_element(field)
 
-    def _create_form_element(self, form_col: dict[str, object]) -> VerticalGroup:
+    def _create_form_element(self, field: FieldDefinition) -> VerticalGroup:
         """
         Creates a form element (label + input widget) based on the provided
         field definition from the configuration.
         """
-        label = Label(f'{form_col["caption"]}:')
-        widget = self._create_widget(form_col)
+        label = Label(f'{field.caption}:')
+        widget = self._create_widget(field)
+        widget.field_name = field.name
 
-        if form_col.get('read_only'):
+        if field.read_only:
             widget.disabled = True
 
-        if input_width := form_col.get('input_width'):
-            label.styles.width = str(int(str(input_width))-1)
-            widget.styles.width = str(int(str(input_width))-1)
-
         group = VerticalGroup(label, widget)
-        if input_width := form_col.get('input_width'):
-            group.styles.width = str(input_width)
+        if input_width := field.input_width:
+            inner_width = str(int(input_width) - 1)
+            label.styles.width  = inner_width
+            widget.styles.width = inner_width
+            group.styles.width  = str(input_width)
         return group
 
     def _create_widget(
-        self, form_col: dict[str, object]
-    ) -> Input | TextArea | Select[str]:
+        self, field: FieldDefinition
+    ) -> TopicInput | TopicTextArea | TopicSelect:
         """
         Creates an input widget based on the field type specified in the
         configuration. Supports 'string', 'select' and 'date' types, with
         appropriate handling for multi-line text areas and select options.
         """
-        match form_col['type']:
-            case 'string':
-                if form_col.get('lines', 1) != 1:
-                    return self._make_textarea(form_col)
-                return self._make_input(form_col)
-            case 'select':
-                return self._make_select(form_col)
-            case 'date':
-                return self._make_input(form_col)
+        match field.type:
+            case FieldType.STRING:
+                if field.lines != 1:
+                    return self._make_textarea(field)
+                return self._make_input(field)
+            case FieldType.SELECT:
+                return self._make_select(field)
+            case FieldType.DATE:
+                return self._make_input(field)
             case _:
-                raise ValueError(f'Unsupported field type: {form_col["type"]}')
+                raise ValueError(
+                    f'Unsupported field type: {field.type.name.lower()}'
+                )
 
     @staticmethod
-    def _make_input(form_col: dict[str, object]) -> Input:
+    def _make_input(field: FieldDefinition) -> TopicInput:
         """
         Creates a standard Input widget with an ID based on the field name for
         easy querying and a common CSS class for styling.
         """
-        return Input(id=f'topics_{form_col["name"]}_input', classes='form-input')
+        return TopicInput(id=f'topics_{field.name}_input', classes='form-input')
 
     @staticmethod
-    def _make_textarea(form_col: dict[str, object]) -> TextArea:
+    def _make_textarea(field: FieldDefinition) -> TopicTextArea:
         """
         Creates a TextArea widget for multi-line string fields, with dynamic
         height based on the 'lines' configuration (negative value for
         auto-height).
         """
-        ta = TextArea(
-            id=f'topics_{form_col["name"]}_input', classes='form-input'
+        ta = TopicTextArea(
+            id=f'topics_{field.name}_input', classes='form-input'
         )
-        lines = int(str(form_col.get('lines', 3)))
-        if lines < 0:
+        if field.lines < 0:
             ta.styles.height = 'auto'
         else:
-            ta.styles.height = lines + 2
+            ta.styles.height = field.lines + 2
         return ta
 
     @staticmethod
-    def _make_select(form_col: dict[str, object]) -> Select[str]:
+    def _make_select(field: FieldDefinition) -> TopicSelect:
         """
         Creates a Select widget for dropdown fields, populating options from the
         configuration and setting an ID for querying and a common CSS class for
         styling.
         """
-        options = cast(list[str], form_col.get('options', []))
-        s: Select[str] = Select((opt, opt) for opt in options)
-        s.id = f'topics_{form_col["name"]}_input'
+        options = cast(list[str], field.options or [])
+        s = TopicSelect((opt, opt) for opt in options)
+        s.id = f'topics_{field.name}_input'
         s.classes = 'form-input'
         return s
 
@@ -135,15 +253,30 @@ class TopicsTab(Static):
     Topics tab - a sortable DataTable plus a detail form below.
 
     Receives ConfigService and TopicsService and exposes helpers that
-    TuidoApp action methods call to manipulate the table and form.
+    TuidoApp action methods call to manipulate the table and form. The first
+    `INITIAL_ROW_COUNT` rows are added synchronously, the remaining ones in
+    chunks of `ROW_CHUNK_SIZE` after each refresh. The form is mounted after
+    the first refresh, so it doesn't delay the first paint of the app.
     """
+    INITIAL_ROW_COUNT: int = 200
+    ROW_CHUNK_SIZE: int = 500
+
+    app: App[None]
     _config: ConfigService
     _service: TopicsService
+    _table_columns: list[FieldDefinition]
+    _table_field_names: tuple[str, ...]
     topics_table: TopicsDataTable
+    _form_container: VerticalScroll
+    _form_mounted: bool
+    _input_ids: dict[str, str]
+    _input_widgets: dict[str, TopicFormWidget]
+    _input_readers: dict[str, InputReader]
+    _input_writers: dict[str, InputWriter]
 
     app_startup: bool = True
-    programmatically_changed_inputs: set[str]
-    user_changed_inputs: set[str]
+    _user_changed_count: int
+    _current_topic_id: int | None
 
 
     def __init__(
@@ -154,149 +287,210 @@ class TopicsTab(Static):
     ) -> None:
         """
         Initializes the `TopicsTab` with the provided `ConfigService` and
-        `TopicsService`, sets up the topics table and prepares tracking for
-        programmatic vs user input changes.
+        `TopicsService`, sets up the topics table and prepares the per-field
+        input accessors.
         """
         super().__init__(**kwargs)  # type:ignore[reportMissingParameterType]
         self._config = config
         self._service = service
+        self._table_columns = config.get_table_columns()
+        self._table_field_names = tuple(
+            col.name for col in self._table_columns
+        )
         self.topics_table = TopicsDataTable()
-        self.programmatically_changed_inputs = set()
-        self.user_changed_inputs = set()
+        self._form_mounted = False
+        self._input_ids = {
+            col.name: f'topics_{col.name}_input' for col in config.get_columns()
+        }
+        self._input_widgets = {}
+        self._input_readers = {}
+        self._input_writers = {}
+        for col in config.get_columns():
+            reader, writer = self._get_input_accessors(col)
+            self._input_readers[col.name] = reader
+            self._input_writers[col.name] = writer
+        self._user_changed_count = 0
+        self._current_topic_id = None
 
     def compose(self) -> ComposeResult:
         yield self.topics_table
         vscroll = VerticalScroll()
         vscroll.can_focus = False
         vscroll.id = 'form_widgets_container'
-        with vscroll:
-            yield TopicFormWidgets(self._config)
+        self._form_container = vscroll
+        yield vscroll
+
+    def on_mount(self) -> None:
+        self.call_after_refresh(self._mount_form)
+
+    async def _mount_form(self) -> None:
+        """
+        Mounts the form widgets into their container and fills them from the
+        selected topic, since a row highlighted before the form existed
+        couldn't do that. This initial fill ends the startup phase.
+        """
+        await self._form_container.mount(TopicFormWidgets(self._config))
+        self._form_mounted = True
+        if self.topics_table.row_count > 0:
+            self.update_input_fields()
+            self.app_startup = False
 
     # ------------------------------------------------------------------------ #
     #  Table initialisation (called from MainScreen.on_mount)                  #
     # ------------------------------------------------------------------------ #
 
     def initialize_table(self) -> None:
-        """Populates columns and rows in the topics table."""
-        self._create_columns()
-        self._add_rows()
+        """
+        Populates columns and the first rows in the topics table within a
+        single batch update, so the table is laid out and rendered once. Large
+        topic sets are completed by `_add_deferred_rows`, which keeps the UI
+        responsive during startup.
+        """
+        topics = self._get_sorted_topics()
+        with self.app.batch_update():
+            self._create_columns()
+            self._add_rows(topics[:self.INITIAL_ROW_COUNT])
+        if len(topics) > self.INITIAL_ROW_COUNT:
+            self.call_after_refresh(
+                self._add_deferred_rows, topics, self.INITIAL_ROW_COUNT
+            )
 
     def _create_columns(self) -> None:
         """
         Creates columns in the topics table based on the configuration,
         including a fixed 'ID' column and dynamic columns for each field marked
-        to show in the table, with specified widths or flexible sizing.
+        to show in the table, with specified widths or flexible sizing. The
+        columns are keyed by field name.
         """
         self.topics_table.add_column('ID', key='id')
-        for col in self._config.get_columns():
-            if col.show_in_table:
-                if col.table_column_width > 0:
-                    self.topics_table.add_column(
-                        col.caption, width=col.table_column_width
-                    )
-                else:
-                    self.topics_table.flexible_columns.append(
-                        self.topics_table.add_column(col.caption)
-                    )
-
-    def _add_rows(self) -> None:
-        """
-        Fetches all topics from the service and adds them as rows to the topics
-        table, ensuring that only fields marked to show in the table are
-        included as cells, and then sorts the table by ID in descending order.
-        """
-        for row in self._service.get_all_topics():
-            cells = [Text(str(row['id']), justify='right')]
-            for col in self._config.get_columns():
-                if col.show_in_table:
-                    cells.append(Text(str(row.get(col.name, ''))))
-            self.topics_table.add_row(*cells)
-        self._sort_table()
-
-    def _sort_table(self) -> None:
-        """
-        Sorts the topics table by the 'ID' column in descending order, using a
-        key function that converts the cell value to an integer for proper
-        numeric sorting, and treating empty or non-numeric values as zero.
-        """
-        self.topics_table.sort(
-            'id',
-            key=lambda v: int(str(v).strip() or 0),
+        for col in self._table_columns:
+            if col.table_column_width > 0:
+                self.topics_table.add_column(
+                    col.caption, width=col.table_column_width, key=col.name
+                )
+            else:
+                self.topics_table.flexible_columns.append(
+                    self.topics_table.add_column(col.caption, key=col.name)
+                )
+
+    def _get_sorted_topics(self) -> list[dict[str, object]]:
+        """
+        Returns all topics from the service sorted by ID in descending order,
+        so the table itself doesn't need to be sorted.
+        """
+        return sorted(
+            self._service.get_all_topics(),
+            key=lambda topic: int(str(topic['id'])),
             reverse=True,
         )
 
+    def _add_deferred_rows(
+        self, topics: list[dict[str, object]], offset: int
+    ) -> None:
+        """
+        Adds the next chunk of rows starting at `offset` and schedules the
+        following chunk after the next refresh until all topics are added.
+        """
+        end = offset + self.ROW_CHUNK_SIZE
+        with self.app.batch_update():
+            self._add_rows(topics[offset:end])
+        if end < len(topics):
+            self.call_after_refresh(self._add_deferred_rows, topics, end)
+
+    def _add_rows(self, topics: list[dict[str, object]]) -> None:
+        """
+        Adds the given topics as rows to the topics table, ensuring that only
+        fields marked to show in the table are included as cells. Each row is
+        keyed by its topic ID.
+        """
+        for topic in topics:
+            self.topics_table.add_row(
+                *self._build_row(topic), key=str(topic['id'])
+            )
+
+    def _build_row(self, topic: dict[str, object]) -> list[Text]:
+        """
+        Builds the table cells for a topic: the right-aligned ID followed by
+        the fields shown in the table, looked up by their precomputed names.
+        """
+        get = topic.get
+        return [
+            TopicIdCell(int(str(topic['id']))),
+            *[Text(str(get(name, ''))) for name in self._table_field_names],
+        ]
+
     # ------------------------------------------------------------------------ #
     #  Actions called by TuidoApp                                              #
     # ------------------------------------------------------------------------ #
 
     def create_new_topic(self) -> None:
-        """Creates a new topic in the service and update the table."""
+        """
+        Creates a new topic in the service and adds it as the first row, since
+        it always has the highest ID.
+        """
         topic = self._service.create_topic()
-        new_id = topic['id']
-        new_row = [Text(str(new_id), justify='right')]
-        for col in self._config.get_columns():
-            if col.show_in_table:
-                new_row.append(Text(''))
-        self.topics_table.add_row(*new_row)
-        self._sort_table()
+        self._current_topic_id = None
+        self.topics_table.add_row(*self._build_row(topic), key=str(topic['id']))
+        self.topics_table.sort_by_id()
         self.topics_table.select_first_row()
 
     def save_topic(self) -> None:
-        """Reads all input widgets and save the currently selected topic."""
-        topic_id = self.topics_table.get_current_id()
-        updated_topic = dict(self._service.get_topic_by_id(topic_id))
-        col_counter = 1
+        """
+        Saves the currently selected topic. Only the inputs flagged as changed
+        by the user are read and written to the topic and the table, all
+        other fields keep their stored value.
+        """
+        topic_id = self.get_current_topic_id()
+        stored_topic = self._service.get_topic_by_id(topic_id)
+        updated_topic = dict(stored_topic)
+        entered_values: dict[str, str] = {}
 
         for field in self._config.get_columns():
-            widget_id = f'#topics_{field.name}_input'
-            match field.type:
-                case FieldType.STRING:
-                    if field.lines == 1:
-                        value = self.query_one(widget_id, Input).value
-                    else:
-                        value = self.query_one(widget_id, TextArea).text
-                case FieldType.SELECT:
-                    sel = cast(Select[str], self.query_one(widget_id, Select))
-                    value = '' if sel.value is Select.NULL else str(sel.value)
-                case _:
-                    value = self.query_one(widget_id, Input).value
+            widget = self._get_input_widget(field)
+            if not widget.user_changed:
+                entered_values[field.name] = str(
+                    stored_topic.get(field.name, '')
+                )
+                continue
 
+            value = self._input_readers[field.name](widget)
             updated_topic[field.name] = value
+            entered_values[field.name] = value
 
             if field.show_in_table:
-                self._update_table_cell(col_counter, value)
-                col_counter += 1
+                self._update_table_cell(topic_id, field.name, value)
 
-        self._service.update_topic(topic_id, updated_topic)
-        self.update_input_fields()
-        logging.info(f'TopicsTab: saved topic id={topic_id}.')
+        saved_topic = self._service.update_topic(topic_id, updated_topic)
+        self._refresh_changed_fields(topic_id, entered_values, saved_topic)
+        logging.info('TopicsTab: saved topic id=%s.', topic_id)
 
     def update_input_fields(self, called_from_discard: bool = False) -> None:
-        """Fills form inputs from the currently selected topic."""
+        """
+        Fills form inputs from the currently selected topic and remembers its
+        ID as the topic shown in the form. Does nothing until the form is
+        mounted (see `_mount_form`).
+        """
+        if not self._form_mounted:
+            return
         topic_id = self.topics_table.get_current_id()
+        self._current_topic_id = topic_id
         try:
             row_data = self._service.get_topic_by_id(topic_id)
-        except Exception as e:
-            logging.error(f'TopicsTab: topic {topic_id} not found: {e}')
+        except KeyError:
+            logging.error('TopicsTab: topic %s not found.', topic_id)
             return
 
+        track_changes = not self.app_startup and not called_from_discard
         for col in self._config.get_columns():
+            raw_value = row_data.get(col.name, '')
+            value = raw_value if isinstance(raw_value, str) else str(raw_value)
             try:
-                value = str(row_data.get(col.name, ''))
-                if not self.app_startup and not called_from_discard:
-                    self.programmatically_changed_inputs.add(
-                        f'topics_{col.name}_input'
-                    )
-                self._set_input_value(col, value)
-            except Exception as e:
-                if not self.app_startup and not called_from_discard:
-                    self.programmatically_changed_inputs.add(
-                        f'topics_{col.name}_input'
-                    )
-                self._set_input_value(col, '')
+                self._set_input_value(col, value, track_changes)
+            except InvalidSelectValueError as e:
+                self._set_input_value(col, '', track_changes)
                 logging.warning(
-                    f'TopicsTab: input update failed for id={topic_id}, '
-                    f'field={col.name}: {e}'
+                    'TopicsTab: input update failed for id=%s, field=%s: %s',
+                    topic_id, col.name, e,
                 )
 
     def delete_topic(self) -> None:
@@ -305,38 +499,150 @@ class TopicsTab(Static):
         from the table.
         """
         topic_id = self.topics_table.get_current_id()
+        self._current_topic_id = None
         self.topics_table.delete_selected_row()
         self._service.delete_topic(topic_id)
 
+    # ------------------------------------------------------------------------ #
+    #  Input-change tracking (used by TuidoApp's change handlers)              #
+    # ------------------------------------------------------------------------ #
+
+    def get_current_topic_id(self) -> int:
+        """
+        Returns the ID of the topic shown in the form. It is taken from the
+        table once per highlighted row instead of on every change event.
+        """
+        if self._current_topic_id is None:
+            self._current_topic_id = self.topics_table.get_current_id()
+        return self._current_topic_id
+
+    def consume_programmatic_change(self, widget: Widget) -> bool:
+        """
+        Returns whether the pending change event of `widget` was caused by
+        writing the value programmatically and resets the flag, so only that
+        single event is ignored.
+        """
+        if is_topic_form_widget(widget) and widget.programmatic_change:
+            widget.programmatic_change = False
+            return True
+        return False
+
+    def read_input(self, widget: TopicFormWidget) -> str:
+        """
+        Returns the current value of a form widget as a string, using the
+        reader of its field (an empty `Select` reads as `''`).
+        """
+        return self._input_readers[widget.field_name](widget)
+
+    def set_user_changed(
+        self, widget: TopicFormWidget, changed: bool
+    ) -> None:
+        """
+        Flags whether the value of `widget` differs from the saved value and
+        highlights the widget accordingly.
+        """
+        widget.set_class(changed, 'changed-input')
+        if widget.user_changed != changed:
+            widget.user_changed = changed
+            self._user_changed_count += 1 if changed else -1
+
+    def has_user_changes(self) -> bool:
+        """Returns whether any form input has unsaved user changes."""
+        return self._user_changed_count > 0
+
+    def clear_user_changes(self) -> None:
+        """
+        Resets the user-change flags and highlighting of all inputs. The class
+        changes are applied in a single batch update.
+        """
+        if self._user_changed_count == 0:
+            return
+        with self.app.batch_update():
+            for widget in self._input_widgets.values():
+                if widget.user_changed:
+                    widget.user_changed = False
+                    widget.remove_class('changed-input')
+        self._user_changed_count = 0
+
     # ------------------------------------------------------------------------ #
     #  Private helpers                                                         #
     # ------------------------------------------------------------------------ #
 
-    def _set_input_value(self, field: FieldDefinition, value: str) -> None:
+    def _set_input_value(
+        self, field: FieldDefinition, value: str, track_change: bool = False
+    ) -> None:
         """
-        Sets the value of an input widget based on the field definition and
-        the provided value, handling different widget types (`Input`,
-        `TextArea`, `Select`) according to the field type and configuration.
+        Sets the value of the input widget of a field using the writer that
+        was chosen for the field's widget type (`Input`, `TextArea`, `Select`).
+
+        Unchanged values are not written, because `TextArea` posts a change
+        event even then. If `track_change` is set, the widget is flagged so
+        the resulting change event isn't treated as a user edit.
+        """
+        widget = self._get_input_widget(field)
+        if self._input_readers[field.name](widget) == value:
+            return
+        self._input_writers[field.name](widget, value)
+        if track_change:
+            widget.programmatic_change = True
+
+    @staticmethod
+    def _get_input_accessors(
+        field: FieldDefinition
+    ) -> tuple[InputReader, InputWriter]:
+        """
+        Returns the reader/writer pair matching the widget type of a field, so
+        the field type only has to be evaluated once when the tab is created.
         """
-        sel = f'#topics_{field.name}_input'
         match field.type:
             case FieldType.STRING:
                 if field.lines == 1:
-                    self.query_one(sel, Input).value = value
-                else:
-                    self.query_one(sel, TextArea).text = value
+                    return _read_input, _write_input
+                return _read_textarea, _write_textarea
             case FieldType.SELECT:
-                sw = cast(Select[str], self.query_one(sel, Select))
-                if value == '':
-                    sw.clear()
-                else:
-                    sw.value = value
+                return _read_select, _write_select
             case _:
-                self.query_one(sel, Input).value = value
+                return _read_input, _write_input
 
-    def _update_table_cell(self, col_index: int, value: str) -> None:
-        from textual.coordinate import Coordinate
-        row_index = self.topics_table.cursor_row
-        self.topics_table.update_cell_at(
-            Coordinate(row_index, col_index), Text(value)
-        )
+    def _refresh_changed_fields(
+        self,
+        topic_id: int,
+        entered_values: dict[str, str],
+        saved_topic: dict[str, object],
+    ) -> None:
+        """
+        Writes back only the fields whose saved value differs from the value
+        shown in the form, i.e. the fields set by a field function such as
+        `edit_date`. All other inputs already show the saved value.
+        """
+        for field in self._config.get_columns():
+            value = str(saved_topic.get(field.name, ''))
+            changed = value != entered_values[field.name]
+            if changed:
+                self._set_input_value(field, value, track_change=True)
+            if changed and field.show_in_table:
+                self._update_table_cell(topic_id, field.name, value)
+
+    def _get_input_widget(self, field: FieldDefinition) -> TopicFormWidget:
+        """
+        Returns the form widget of a field. The widget is queried from the DOM
+        only once and then served from `_input_widgets`, since the form widgets
+        live as long as the tab.
+        """
+        widget = self._input_widgets.get(field.name)
+        if widget is None:
+            widget = cast(
+                TopicFormWidget,
+                self.query_one(f'#{self._input_ids[field.name]}'),
+            )
+            self._input_widgets[field.name] = widget
+        return widget
+
+    def _update_table_cell(
+        self, topic_id: int, field_name: str, value: str
+    ) -> None:
+        """
+        Updates the table cell of a topic's field, addressed by the row key
+        (topic ID) and column key (field name) instead of the cursor position.
+        """
+        self.topics_table.update_cell(str(topic_id), field_name, Text(value))
@@ -1,6 +1,6 @@
-import re
-from enum import Enum
-from datetime import datetime, timedelta
+from enum import Enum, IntEnum
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 from textual import work
 from textual import events
@@ -9,6 +9,7 @@ from textual.binding import Binding
 from textual.containers import HorizontalGroup, VerticalGroup
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Input, Label, Select, MaskedInput, ListView, Static, Footer
 )
@@ -16,14 +17,39 @@ from termz.tui.question_screen import QuestionScreen  # type: ignore
 from tuido.domain.models import Task, TaskPriority
 
 
+# Option of the priority select for each priority (NONE has no option)
+_PRIORITY_OPTIONS = {
+    TaskPriority.HIGH:   'High',
+    TaskPriority.MEDIUM: 'Medium',
+    TaskPriority.LOW:    'Low',
+}
+
+
+def _parse_date(date_str: str) -> date | None:
+    """
+    Parses a date in the format YYYY-MM-DD, which is what the date inputs
+    produce. Returns None if the string isn't a valid calendar date in that
+    format. Slicing the fixed positions is much cheaper than `strptime`, which
+    matters because the inputs are parsed on every keystroke.
+    """
+    if (len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-'
+            or not (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()):
+        return None
+    try:
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    except ValueError:
+        return None
+
+
 class DateName(Enum):
     START_DATE = 'start_date'
     END_DATE   = 'end_date'
 
 
-class DateAdjustment(Enum):
-    DECREASE = 'decrease'
-    INCREASE = 'increase'
+class DateAdjustment(IntEnum):
+    """Direction of a date adjustment, usable directly as a day offset."""
+    DECREASE = -1
+    INCREASE = 1
 
 
 class TaskEditScreen(ModalScreen[None]):
@@ -46,6 +72,7 @@ class TaskEditScreen(ModalScreen[None]):
         Binding('f9',     'clear_start_date',    'Clear Start'),
         Binding('f10',    'clear_end_date',      'Clear End'),
     ]
+    WEEKDAY_DELAY: float = 0.05
 
     app: App[None]
     list_views: dict[str, ListView | Any]
@@ -57,6 +84,7 @@ class TaskEditScreen(ModalScreen[None]):
     end_date_weekday_label: Label
     invalid_inputs: set[str]
     original_task: Task | None
+    _weekday_timer: Timer | None
 
 
     class Submit(Message):
@@ -91,6 +119,7 @@ class TaskEditScreen(ModalScreen[None]):
         self.list_views    = list_views
         self.invalid_inputs = set()
         self.original_task  = None
+        self._weekday_timer = None
 
         self.description_input = Input(placeholder='Enter description')
 
@@ -172,13 +201,11 @@ class TaskEditScreen(ModalScreen[None]):
         """Clears the start date input and updates the weekday label."""
         self.start_date_input.value = ''
         self._update_weekday_labels()
-        self.start_date_input.refresh()
 
     def action_clear_end_date(self) -> None:
         """Clears the end date input and updates the weekday label."""
         self.end_date_input.value = ''
         self._update_weekday_labels()
-        self.end_date_input.refresh()
 
     # ------------------------------------------------------------------------ #
     #  Public helpers (called by TuidoApp)                                     #
@@ -191,18 +218,9 @@ class TaskEditScreen(ModalScreen[None]):
         self.start_date_input.value  = task.start_date
         self.end_date_input.value    = task.end_date
 
-        priority_str: str | None
-        match task.priority:
-            case TaskPriority.HIGH:
-                priority_str = 'High'
-            case TaskPriority.MEDIUM:
-                priority_str = 'Medium'
-            case TaskPriority.LOW:
-                priority_str = 'Low'
-            case _:
-                priority_str = None
-
-        self.call_after_refresh(self._set_priority_value, priority_str)
+        priority_str = _PRIORITY_OPTIONS.get(task.priority)
+        if priority_str is not None:
+            self.call_after_refresh(self._set_priority_value, priority_str)
 
     # ------------------------------------------------------------------------ #
     #  Event handlers                                                          #
@@ -216,18 +234,24 @@ class TaskEditScreen(ModalScreen[None]):
         `invalid_inputs` set. If the input becomes valid, it removes the class
         and discards the ID from the set. This allows the screen to keep track
         of which inputs are currently invalid and prevent submission until
-        they are corrected.
+        they are corrected. The weekday labels are only updated once typing
+        has paused for `WEEKDAY_DELAY` seconds.
         """
-        if event.input.id in ('start_date', 'end_date'):
+        widget   = event.input
+        input_id = widget.id
+        if input_id in ('start_date', 'end_date'):
             value = event.value
-            if self._is_valid_date(value) or value == '':
-                self.invalid_inputs.discard(event.input.id)
-                event.input.remove_class('invalid_input')
+            valid = not value or self._is_valid_date(value)
+            if valid:
+                self.invalid_inputs.discard(input_id)
             else:
-                self.invalid_inputs.add(event.input.id)
-                event.input.add_class('invalid_input')
-            self._update_weekday_labels()
-            event.input.refresh()
+                self.invalid_inputs.add(input_id)
+            widget.set_class(not valid, 'invalid_input')
+            if self._weekday_timer is not None:
+                self._weekday_timer.stop()
+            self._weekday_timer = self.set_timer(
+                self.WEEKDAY_DELAY, self._update_weekday_labels
+            )
 
     async def on_key(self, _event: events.Key) -> None:
         pass
@@ -236,14 +260,14 @@ class TaskEditScreen(ModalScreen[None]):
     #  Private helpers                                                         #
     # ------------------------------------------------------------------------ #
 
-    def _set_priority_value(self, priority: str | None) -> None:
+    def _set_priority_value(self, priority: str) -> None:
         """
         Sets the priority input value based on the task's priority. This is
         called after the screen is refreshed to ensure that the priority input
-        is available in the widget tree. If the task has no priority, it leaves
-        the input unchanged.
+        is available in the widget tree. Tasks without a priority don't
+        schedule this call, so the input is left unchanged for them.
         """
-        if priority:
+        if self.priority_input.value != priority:
             self.priority_input.value = priority
 
     def _adjust_date(
@@ -252,55 +276,49 @@ class TaskEditScreen(ModalScreen[None]):
         """
         Adjusts the specified date input by one day in the specified direction.
         If the input is empty, it sets it to today's date. After adjusting, it
-        calls `_sync_dates` to ensure that the start date is not after the end
-        date and updates the weekday labels accordingly.
+        calls `_sync_dates` with both parsed dates to ensure that the start
+        date is not after the end date and updates the weekday labels
+        accordingly.
         The `adjustment` parameter determines whether to increase or decrease
         the date, and the `date_name` parameter specifies which date input to
         adjust (start or end).
         """
-        widget = (
-            self.start_date_input
-            if date_name == DateName.START_DATE
-            else self.end_date_input
-        )
-        delta = timedelta(
-            days=1 if adjustment == DateAdjustment.INCREASE else -1
+        is_start = date_name == DateName.START_DATE
+        widget, other = (
+            (self.start_date_input, self.end_date_input)
+            if is_start
+            else (self.end_date_input, self.start_date_input)
         )
 
         if widget.value:
-            try:
-                date = datetime.strptime(widget.value, '%Y-%m-%d')
-                widget.value = (date + delta).strftime('%Y-%m-%d')
-            except ValueError:
-                pass
+            value = _parse_date(widget.value)
+            if value is not None:
+                value += timedelta(days=adjustment)
+                widget.value = value.isoformat()
         else:
-            widget.value = datetime.now().strftime('%Y-%m-%d')
+            value = date.today()
+            widget.value = value.isoformat()
 
-        adjust_start = (
-            date_name == DateName.END_DATE
-            and adjustment == DateAdjustment.DECREASE
-        )
-        self._sync_dates(adjust_start)
-        widget.refresh()
+        other_value = _parse_date(other.value)
+        if is_start:
+            self._sync_dates(value, other_value)
+        else:
+            self._sync_dates(
+                other_value, value,
+                adjust_start=adjustment == DateAdjustment.DECREASE,
+            )
 
-    def _sync_dates(self, adjust_start: bool = False) -> None:
+    def _sync_dates(
+        self, start: date | None, end: date | None, adjust_start: bool = False
+    ) -> None:
         """
-        Ensures that the start date is not after the end date. If the start date
-        is greater than the end date, it adjusts either the start or end date
-        based on the `adjust_start` parameter. If `adjust_start` is True, it
-        decreases the start date by one day; otherwise, it sets the end date
-        to be the same as the start date. After syncing, it updates the weekday
-        labels and refreshes the end date input to reflect any changes.
+        Ensures that the start date is not after the end date, given the parsed
+        values of both inputs. If the start date is greater than the end date,
+        it adjusts either the start or end date based on the `adjust_start`
+        parameter. If `adjust_start` is True, it decreases the start date by
+        one day; otherwise, it sets the end date to be the same as the start
+        date. After syncing, it updates the weekday labels.
         """
-        try:
-            start = datetime.strptime(self.start_date_input.value, '%Y-%m-%d')
-        except ValueError:
-            start = None
-        try:
-            end = datetime.strptime(self.end_date_input.value, '%Y-%m-%d')
-        except ValueError:
-            end = None
-
         if start and end and start > end:
             if adjust_start:
                 self._adjust_date(DateName.START_DATE, DateAdjustment.DECREASE)
@@ -308,7 +326,6 @@ class TaskEditScreen(ModalScreen[None]):
                 self.end_date_input.value = self.start_date_input.value
 
         self._update_weekday_labels()
-        self.end_date_input.refresh()
 
     async def _discard_unsaved_changes(self) -> bool:
         """
@@ -317,14 +334,12 @@ class TaskEditScreen(ModalScreen[None]):
         the user with a confirmation dialog using the `QuestionScreen`.
         If the user confirms, it returns `True`; otherwise, it returns `False`.
         If there are no changes, it returns `True` immediately without showing
-        the dialog.
+        the dialog. The priority is only converted if the text fields are
+        unchanged.
         """
         from tuido.tui.app import TuidoApp
         app: TuidoApp = self.app  # type: ignore[assignment]
-        prio_num = app.tasks_service.priority_str_to_num(
-            str(self.priority_input.value)
-        )
-        prio = app.tasks_service.num_to_priority(prio_num)
+        service = app.tasks_service
 
         original = self.original_task or Task(
             column_name='', description='', priority=TaskPriority.LOW,
@@ -333,9 +348,11 @@ class TaskEditScreen(ModalScreen[None]):
 
         if (
             self.description_input.value != original.description
-            or prio != original.priority
             or self.start_date_input.value != original.start_date
             or self.end_date_input.value != original.end_date
+            or service.num_to_priority(
+                service.priority_str_to_num(str(self.priority_input.value))
+            ) != original.priority
         ):
             return bool(
                 await app.push_screen_wait(
@@ -374,42 +391,39 @@ class TaskEditScreen(ModalScreen[None]):
         weekday in parentheses; if the date is invalid or empty, it clears the
         label. This method is called whenever the date inputs change to provide
         immediate feedback to the user about the day of the week
-        corresponding to the entered date.
+        corresponding to the entered date. A label is only updated if its text
+        changes, since `update` always triggers a layout refresh.
         """
-        self.start_date_weekday_label.update(
-            self._weekday_name(self.start_date_input.value)
-        )
-        self.end_date_weekday_label.update(
-            self._weekday_name(self.end_date_input.value)
-        )
+        self._weekday_timer = None
+        for label, date_input in (
+            (self.start_date_weekday_label, self.start_date_input),
+            (self.end_date_weekday_label,   self.end_date_input),
+        ):
+            weekday = self._weekday_name(date_input.value)
+            if label.content != weekday:
+                label.update(weekday)
 
     @staticmethod
     def _is_valid_date(date_str: str) -> bool:
         """
         Validates that the date string is in the format YYYY-MM-DD and
-        represents a valid calendar date. It first checks the format using a
-        regular expression and then attempts to parse the date.
+        represents a valid calendar date.
         """
-        if not re.fullmatch(r'\d{4}-\d{2}-\d{2}', date_str):
-            return False
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
+        return _parse_date(date_str) is not None
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _weekday_name(date_str: str) -> str:
         """
         Returns the weekday name in parentheses for a given date string.
         If the date string is empty or invalid, it returns an empty string.
+        The result is cached per string, since both labels are rebuilt
+        whenever either date input changes.
         """
-        if not date_str:
-            return ''
-        try:
-            return f'({datetime.strptime(date_str, "%Y-%m-%d").strftime("%A")})'
-        except ValueError:
+        value = _parse_date(date_str)
+        if value is None:
             return ''
+        return f'({value.strftime("%A")})'
 
     def set_list_view_state(self, enabled: bool) -> None:
         """